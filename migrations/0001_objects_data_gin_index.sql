@@ -0,0 +1,3 @@
+-- Replace objects content index with a jsonb_path_ops GIN index on data
+DROP INDEX IF EXISTS idx_objects_content;
+CREATE INDEX IF NOT EXISTS idx_objects_data_gin ON objects USING GIN (data jsonb_path_ops);
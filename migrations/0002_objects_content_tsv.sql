@@ -0,0 +1,4 @@
+-- Add generated tsvector column and GIN index for object full-text search
+ALTER TABLE objects ADD COLUMN IF NOT EXISTS content_tsv tsvector
+    GENERATED ALWAYS AS (to_tsvector('simple', coalesce(content, ''))) STORED;
+CREATE INDEX IF NOT EXISTS idx_objects_content_tsv ON objects USING GIN (content_tsv);
@@ -0,0 +1,3 @@
+-- Add composite indexes for keyset pagination of inbox and outbox
+CREATE INDEX IF NOT EXISTS idx_activities_actor_created ON activities (actor, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_activities_target_visibility_created ON activities (target_id, visibility, created_at DESC);
@@ -0,0 +1,2 @@
+-- Add (created_at, id) index for tie-broken collection cursors
+CREATE INDEX IF NOT EXISTS idx_activities_created_id ON activities (created_at DESC, id DESC);
@@ -0,0 +1,6 @@
+-- Replace follow indexes with partial indexes on accepted follows and index public activities
+DROP INDEX IF EXISTS idx_follows_follower;
+DROP INDEX IF EXISTS idx_follows_following;
+CREATE INDEX IF NOT EXISTS idx_follows_follower_accepted ON follows (follower) WHERE accepted = true;
+CREATE INDEX IF NOT EXISTS idx_follows_following_accepted ON follows (following) WHERE accepted = true;
+CREATE INDEX IF NOT EXISTS idx_activities_actor_public_created ON activities (actor, created_at DESC) WHERE visibility = 'public';
@@ -0,0 +1,7 @@
+-- Index each side of the inbox UNION ALL in (created_at, id) order
+DROP INDEX IF EXISTS idx_activities_target_visibility_created;
+CREATE INDEX IF NOT EXISTS idx_activities_target_inbox ON activities (target_id, created_at DESC, id DESC) WHERE visibility IN ('public', 'followers');
+DROP INDEX IF EXISTS idx_activities_actor_created;
+CREATE INDEX idx_activities_actor_created ON activities (actor, created_at DESC, id DESC);
+DROP INDEX IF EXISTS idx_activities_actor_public_created;
+CREATE INDEX idx_activities_actor_public_created ON activities (actor, created_at DESC, id DESC) WHERE visibility = 'public';
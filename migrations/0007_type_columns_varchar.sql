@@ -0,0 +1,47 @@
+-- Store activity/object/actor types as validated VARCHAR instead of Postgres enums
+ALTER TABLE activities ALTER COLUMN type TYPE VARCHAR(32) USING
+    CASE type::text
+        WHEN 'CREATE' THEN 'Create'
+        WHEN 'FOLLOW' THEN 'Follow'
+        WHEN 'LIKE' THEN 'Like'
+        WHEN 'ANNOUNCE' THEN 'Announce'
+        WHEN 'DELETE' THEN 'Delete'
+        WHEN 'UPDATE' THEN 'Update'
+        WHEN 'UNDO' THEN 'Undo'
+        WHEN 'ACCEPT' THEN 'Accept'
+        WHEN 'REJECT' THEN 'Reject'
+        WHEN 'ADD' THEN 'Add'
+        WHEN 'REMOVE' THEN 'Remove'
+        WHEN 'BLOCK' THEN 'Block'
+    END;
+ALTER TABLE activities ADD CONSTRAINT ck_activities_type CHECK (type IN ('Create', 'Follow', 'Like', 'Announce', 'Delete', 'Update', 'Undo', 'Accept', 'Reject', 'Add', 'Remove', 'Block'));
+ALTER TABLE objects ALTER COLUMN type TYPE VARCHAR(32) USING
+    CASE type::text
+        WHEN 'NOTE' THEN 'Note'
+        WHEN 'ARTICLE' THEN 'Article'
+        WHEN 'IMAGE' THEN 'Image'
+        WHEN 'VIDEO' THEN 'Video'
+        WHEN 'AUDIO' THEN 'Audio'
+        WHEN 'PERSON' THEN 'Person'
+        WHEN 'GROUP' THEN 'Group'
+        WHEN 'ORGANIZATION' THEN 'Organization'
+        WHEN 'COLLECTION' THEN 'Collection'
+        WHEN 'ORDERED_COLLECTION' THEN 'OrderedCollection'
+    END;
+ALTER TABLE objects ADD CONSTRAINT ck_objects_type CHECK (type IN ('Note', 'Article', 'Image', 'Video', 'Audio', 'Person', 'Group', 'Organization', 'Collection', 'OrderedCollection'));
+ALTER TABLE actors ALTER COLUMN type TYPE VARCHAR(32) USING
+    CASE type::text
+        WHEN 'NOTE' THEN 'Note'
+        WHEN 'ARTICLE' THEN 'Article'
+        WHEN 'IMAGE' THEN 'Image'
+        WHEN 'VIDEO' THEN 'Video'
+        WHEN 'AUDIO' THEN 'Audio'
+        WHEN 'PERSON' THEN 'Person'
+        WHEN 'GROUP' THEN 'Group'
+        WHEN 'ORGANIZATION' THEN 'Organization'
+        WHEN 'COLLECTION' THEN 'Collection'
+        WHEN 'ORDERED_COLLECTION' THEN 'OrderedCollection'
+    END;
+ALTER TABLE actors ADD CONSTRAINT ck_actors_type CHECK (type IN ('Note', 'Article', 'Image', 'Video', 'Audio', 'Person', 'Group', 'Organization', 'Collection', 'OrderedCollection'));
+DROP TYPE IF EXISTS activitytype;
+DROP TYPE IF EXISTS objecttype;
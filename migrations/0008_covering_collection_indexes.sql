@@ -0,0 +1,7 @@
+-- Make follow and like collection pages index-only scans
+DROP INDEX IF EXISTS idx_follows_follower_accepted;
+CREATE INDEX idx_follows_follower_accepted ON follows (follower, created_at DESC, id DESC) INCLUDE (following) WHERE accepted = true;
+DROP INDEX IF EXISTS idx_follows_following_accepted;
+CREATE INDEX idx_follows_following_accepted ON follows (following, created_at DESC, id DESC) INCLUDE (follower) WHERE accepted = true;
+DROP INDEX IF EXISTS idx_likes_object;
+CREATE INDEX idx_likes_object ON likes (object_id, created_at DESC, id DESC) INCLUDE (actor_id);
@@ -30,6 +30,7 @@ setup(
         "blurhash>=1.1.4",
         "aioboto3>=12.3.0",
         "aiofiles>=24.1.0",
+        "orjson>=3.9.0",
     ],
     extras_require={
         "fastapi": ["fastapi>=0.68.0", "uvicorn>=0.15.0"],
@@ -39,6 +40,9 @@ setup(
             "pytest>=6.2.5",
             "pytest-asyncio>=0.15.1",
             "pytest-cov>=2.12.1",
+            "pytest-xdist>=3.0.0",
+            "aioresponses>=0.7.4",
+            "uvloop>=0.17.0; sys_platform != 'win32'",
             "black>=22.3.0",
             "isort>=5.10.1",
             "flake8>=4.0.1",
@@ -3,18 +3,8 @@ pyfed package initialization.
 """
 # from .plugins import plugin_manager  # Update the import path
 
-# Export all models
-from .models import (
-    APObject, APEvent, APPlace, APProfile, APRelationship, APTombstone,
-    APArticle, APAudio, APDocument, APImage, APNote, APPage, APVideo,
-    APActor, APPerson, APGroup, APOrganization, APApplication, APService,
-    APLink, APMention,
-    APCollection, APOrderedCollection, APCollectionPage, APOrderedCollectionPage,
-    APCreate, APUpdate, APDelete, APFollow, APUndo, APLike, APAnnounce
-)
-
-# Export serializers
-from .serializers.json_serializer import ActivityPubSerializer
+import importlib
+from typing import Any, List
 
 __all__ = [
     'APObject', 'APEvent', 'APPlace', 'APProfile', 'APRelationship', 'APTombstone',
@@ -25,3 +15,19 @@ __all__ = [
     'APCreate', 'APUpdate', 'APDelete', 'APFollow', 'APUndo', 'APLike', 'APAnnounce',
     'ActivityPubSerializer'
 ]
+
+# Exports resolve on first access, so importing a subpackage such as
+# pyfed.federation does not load every model
+def __getattr__(name: str) -> Any:
+    if name == 'ActivityPubSerializer':
+        module = importlib.import_module('.serializers.json_serializer', __name__)
+    elif name in __all__:
+        module = importlib.import_module('.models', __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
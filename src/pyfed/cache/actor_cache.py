@@ -17,9 +17,18 @@ class ActorCache:
         """Get actor data from cache."""
         return await self.cache.get(f"actor:{actor_id}")
 
-    async def set(self, actor_id: str, actor_data: Dict[str, Any]) -> None:
+    async def set(
+        self,
+        actor_id: str,
+        actor_data: Dict[str, Any],
+        ttl: Optional[int] = None
+    ) -> None:
         """Set actor data in cache."""
-        await self.cache.set(f"actor:{actor_id}", actor_data, self.ttl)
+        await self.cache.set(
+            f"actor:{actor_id}",
+            actor_data,
+            ttl if ttl is not None else self.ttl
+        )
 
     async def delete(self, actor_id: str) -> None:
         """Delete actor data from cache."""
@@ -3,16 +3,33 @@ In-memory cache implementation.
 """
 
 from typing import Dict, Any, Optional
+from collections import OrderedDict
 from datetime import datetime, timedelta
 
+def parse_max_age(cache_control: Optional[str]) -> Optional[int]:
+    """Get max-age seconds from a Cache-Control header, if present."""
+    if not cache_control:
+        return None
+    for directive in cache_control.split(','):
+        name, _, value = directive.strip().partition('=')
+        if name.lower() in ('no-store', 'no-cache'):
+            return 0
+        if name.lower() == 'max-age':
+            try:
+                return max(int(value.strip('"')), 0)
+            except ValueError:
+                return None
+    return None
+
 class MemoryCache:
-    """Simple in-memory cache."""
+    """Simple in-memory cache, evicting least recently used past maxsize."""
 
-    def __init__(self, ttl: int = 3600):
+    def __init__(self, ttl: int = 3600, maxsize: Optional[int] = None):
         """Initialize cache."""
-        self.data: Dict[str, Any] = {}
+        self.data: Dict[str, Any] = OrderedDict()
         self.expires: Dict[str, datetime] = {}
         self.ttl = ttl
+        self.maxsize = maxsize
 
     async def get(self, key: str) -> Optional[Any]:
         """Get value from cache."""
@@ -25,14 +42,21 @@ class MemoryCache:
             del self.expires[key]
             return None
             
+        self.data.move_to_end(key)
         return self.data[key]
 
     async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """Set value in cache."""
         self.data[key] = value
+        self.data.move_to_end(key)
         self.expires[key] = datetime.utcnow() + timedelta(
             seconds=ttl if ttl is not None else self.ttl
         )
+        
+        if self.maxsize is not None:
+            while len(self.data) > self.maxsize:
+                oldest, _ = self.data.popitem(last=False)
+                self.expires.pop(oldest, None)
 
     async def delete(self, key: str) -> None:
         """Delete value from cache."""
@@ -14,13 +14,14 @@ logger = get_logger(__name__)
 class WebFingerCache:
     """Cache for WebFinger lookups."""
     
-    def __init__(self, ttl: int = 3600):  # 1 hour default TTL
+    def __init__(self, ttl: int = 3600, maxsize: int = 10_000):  # 1 hour default TTL
         """Initialize WebFinger cache.
         
         Args:
             ttl: Cache TTL in seconds
+            maxsize: Maximum number of cached lookups
         """
-        self.cache = MemoryCache(ttl)
+        self.cache = MemoryCache(ttl, maxsize)
         
     async def get(self, resource: str) -> Optional[Dict[str, Any]]:
         """Get WebFinger data from cache.
@@ -33,14 +34,20 @@ class WebFingerCache:
         """
         return await self.cache.get(resource)
         
-    async def set(self, resource: str, data: Dict[str, Any]) -> None:
+    async def set(
+        self,
+        resource: str,
+        data: Dict[str, Any],
+        ttl: Optional[int] = None
+    ) -> None:
         """Cache WebFinger data.
         
         Args:
             resource: WebFinger resource URI
             data: WebFinger data to cache
+            ttl: Optional TTL override in seconds
         """
-        await self.cache.set(resource, data)
+        await self.cache.set(resource, data, ttl)
         
     async def delete(self, resource: str) -> None:
         """Remove WebFinger data from cache.
@@ -3,39 +3,50 @@ federation/delivery.py
 Activity delivery implementation with shared inbox optimization.
 """
 
-from typing import Dict, Any, Optional, List, Set
+from typing import Dict, Any, Optional, List, Set, Union
 from urllib.parse import urlparse
 import aiohttp
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 import asyncio
 import certifi
 import ssl
 import json
+import random
 from collections import defaultdict
 
 from ..utils.exceptions import DeliveryError
 from ..utils.logging import get_logger
+from ..cache.memory_cache import MemoryCache
 from ..security.key_management import KeyManager
 from ..security.http_signatures import HTTPSignatureVerifier
 from ..federation.discovery import InstanceDiscovery
 from ..federation.rate_limit import RateLimiter, RateLimit
-from ..serializers.json_serializer import ActivityPubSerializer
+from ..serializers.json_serializer import ActivityPubBase, ActivityPubSerializer
 
 logger = get_logger(__name__)
 
 @dataclass
 class DeliveryResult:
     """Delivery result."""
-    success: List[str] = None
-    failed: List[str] = None
+    success: Set[str] = None
+    failed: Set[str] = None
     status_code: Optional[int] = None
     error_message: Optional[str] = None
     retry_after: Optional[int] = None
     
     def __post_init__(self):
-        self.success = self.success or []
-        self.failed = self.failed or []
+        self.success = set(self.success or ())
+        self.failed = set(self.failed or ())
+
+@dataclass
+class DeliveryJob:
+    """Queued delivery of an activity to one inbox."""
+    activity: Union[Dict[str, Any], ActivityPubBase]
+    inbox_url: str
+    username: Optional[str]
+    future: asyncio.Future
 
 class ActivityDelivery:
     """Activity delivery implementation with shared inbox optimization."""
@@ -47,7 +58,10 @@ class ActivityDelivery:
         timeout: int = 30,
         max_retries: int = 3,
         retry_delay: int = 20,
-        max_concurrent: int = 10
+        max_concurrent: int = 10,
+        max_retry_delay: int = 300,
+        queue_size: int = 10_000,
+        shared_inbox_ttl: int = 3600
     ):
         """Initialize delivery service."""
         self.key_manager = key_manager
@@ -55,8 +69,16 @@ class ActivityDelivery:
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
         self.max_concurrent = max_concurrent
+        self.queue_size = queue_size
         self.session = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_tasks: List[asyncio.Task] = []
+        
+        # Shared inbox per host ("" when the host has none), so fan-outs
+        # don't repeat discovery for every host on every delivery
+        self._shared_inboxes = MemoryCache(ttl=shared_inbox_ttl, maxsize=10_000)
         
         # Initialize HTTP signature verifier
         self.signature_verifier = HTTPSignatureVerifier(key_manager=key_manager)
@@ -70,22 +92,96 @@ class ActivityDelivery:
             )
         )
         
+    async def initialize(self) -> None:
+        """Initialize HTTP session and delivery workers."""
+        await self._get_session()
+        self._start_workers()
+        
+    def _start_workers(self) -> None:
+        """Start background delivery workers if not running."""
+        if self._worker_tasks:
+            return
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._worker_tasks = [
+            asyncio.create_task(self._worker())
+            for _ in range(self.max_concurrent)
+        ]
+        
+    async def _worker(self) -> None:
+        """Deliver queued jobs until cancelled."""
+        while True:
+            job = await self._queue.get()
+            try:
+                if not job.future.done():
+                    result = await self.deliver_to_inbox(
+                        job.activity,
+                        job.inbox_url,
+                        job.username
+                    )
+                    if not job.future.done():
+                        job.future.set_result(result)
+            except asyncio.CancelledError:
+                # Stopped mid-delivery by close(); don't leave waiters hanging
+                job.future.cancel()
+                raise
+            except Exception as e:
+                if not job.future.done():
+                    job.future.set_exception(e)
+            finally:
+                self._queue.task_done()
+                
+    async def enqueue(
+        self,
+        activity: Union[Dict[str, Any], ActivityPubBase],
+        inbox_url: str,
+        username: Optional[str] = None
+    ) -> asyncio.Future:
+        """
+        Queue activity for background delivery to an inbox.
+        
+        Returns as soon as the job is queued; the returned future resolves
+        to the DeliveryResult once a worker has delivered it.
+        """
+        self._start_workers()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(DeliveryJob(activity, inbox_url, username, future))
+        return future
+        
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create HTTP session."""
+        """
+        Get or create HTTP session.
+        
+        One session is shared by all deliveries so connections to a host
+        are pooled and kept alive instead of re-handshaking per request.
+        """
         if self.session is None or self.session.closed:
             ssl_context = ssl.create_default_context(cafile=certifi.where())
-            connector = aiohttp.TCPConnector(ssl=ssl_context)
-            self.session = aiohttp.ClientSession(connector=connector)
+            connector = aiohttp.TCPConnector(
+                ssl=ssl_context,
+                limit=200,
+                limit_per_host=32,
+                keepalive_timeout=30,
+                ttl_dns_cache=300
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
         return self.session
         
     async def deliver_to_inbox(
         self,
-        activity: Dict[str, Any],
+        activity: Union[Dict[str, Any], ActivityPubBase],
         inbox_url: str,
-        username: Optional[str] = None,
-        retry_count: int = 0
+        username: Optional[str] = None
     ) -> DeliveryResult:
-        """Deliver activity to an inbox."""
+        """
+        Deliver activity to an inbox.
+        
+        activity may be a dict or an ActivityPub model; a model's cached
+        JSON bytes are sent as-is. 429 and 5xx responses are retried up to max_retries times with
+        exponential backoff, honouring Retry-After.
+        """
         parsed_url = urlparse(inbox_url)
         domain = parsed_url.netloc
         result = DeliveryResult()
@@ -104,66 +200,174 @@ class ActivityDelivery:
                 'Host': domain  # Add host header required for signature
             }
             
-            # Sign request using HTTPSignatureVerifier
-            signed_headers = await self.signature_verifier.sign_request(
-                method='POST',
-                path=parsed_url.path,
-                headers=headers,
-                body=activity,  # Pass original dict for digest calculation
-                username=username  # Pass username for key ID
-            )
-            
-            # Use standardized JSON serialization
-            body_json = ActivityPubSerializer.to_json_string(activity)
-            
-            # Make request with pre-serialized JSON
+            # Serialize once; the digest is computed over these exact bytes.
+            # Models keep their bytes, so a fan-out serializes them once
+            if isinstance(activity, ActivityPubBase):
+                body = activity.to_json_bytes()
+            else:
+                body = ActivityPubSerializer.to_json_bytes(activity)
             session = await self._get_session()
-            async with session.post(
-                inbox_url,
-                data=body_json,  # Use pre-serialized JSON
-                headers=signed_headers,  # Use signed headers directly
-                timeout=self.timeout
-            ) as response:
-                # Update rate limit state
-                await self.rate_limiter.update_rate_limit(
-                    domain,
-                    response.headers
+            
+            for attempt in range(self.max_retries + 1):
+                # Sign request using HTTPSignatureVerifier; retries re-sign
+                # so the Date header stays fresh
+                signed_headers = await self.signature_verifier.sign_request(
+                    method='POST',
+                    path=parsed_url.path,
+                    headers=headers,
+                    body=body,  # Digest is taken over the body bytes
+                    username=username  # Pass username for key ID
                 )
                 
-                if response.status in (200, 201, 202):  
-                    result.success.append(inbox_url)
-                    result.status_code = response.status
-                    return result
-                    
-                if response.status == 429 or (
-                    response.status >= 500 and retry_count < self.max_retries
-                ):
-                    # Calculate retry delay
-                    retry_after = int(response.headers.get('Retry-After', self.retry_delay))
-                    await asyncio.sleep(retry_after)
-                    
-                    # Retry delivery
-                    return await self.deliver_to_inbox(
-                        activity=activity,
-                        inbox_url=inbox_url,
-                        username=username,
-                        retry_count=retry_count + 1
+                # Make request with pre-serialized JSON
+                async with session.post(
+                    inbox_url,
+                    data=body,  # Use pre-serialized JSON
+                    headers=signed_headers  # Use signed headers directly
+                ) as response:
+                    # Update rate limit state
+                    await self.rate_limiter.update_rate_limit(
+                        domain,
+                        response.headers
                     )
                     
-                result.failed.append(inbox_url)
-                result.status_code = response.status
-                result.error_message = await response.text()
+                    if response.status in (200, 201, 202):  
+                        result.success.add(inbox_url)
+                        result.status_code = response.status
+                        return result
+                        
+                    retryable = response.status == 429 or response.status >= 500
+                    if not retryable or attempt == self.max_retries:
+                        result.failed.add(inbox_url)
+                        result.status_code = response.status
+                        result.error_message = await response.text()
+                        return result
+                        
+                    delay = self._backoff(attempt, response.headers.get('Retry-After'))
+                    
+                # Sleep after the response is released so the pooled
+                # connection can be reused by the retry
+                await asyncio.sleep(delay)
                 
         except asyncio.TimeoutError:
-            result.failed.append(inbox_url)
+            result.failed.add(inbox_url)
             result.error_message = "Delivery timeout"
             
         except Exception as e:
-            result.failed.append(inbox_url)
+            result.failed.add(inbox_url)
             result.error_message = str(e)
             
         return result
         
+    def _backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Calculate delay before the next delivery attempt.
+        
+        Uses exponential backoff from retry_delay, never shorter than
+        Retry-After, both capped at max_retry_delay, plus jitter.
+        """
+        delay = min(self.retry_delay * 2 ** attempt, self.max_retry_delay)
+        
+        if retry_after:
+            try:
+                wait = float(retry_after)
+            except ValueError:
+                try:
+                    retry_at = parsedate_to_datetime(retry_after)
+                    wait = (retry_at - datetime.now(timezone.utc)).total_seconds()
+                except (TypeError, ValueError):
+                    wait = 0
+            delay = max(delay, min(wait, self.max_retry_delay))
+            
+        return delay + random.uniform(0, self.retry_delay)
+        
+    async def deliver_to_inboxes(
+        self,
+        activity: Union[Dict[str, Any], ActivityPubBase],
+        inbox_urls: List[str],
+        username: Optional[str] = None,
+        use_shared_inbox: bool = True
+    ) -> DeliveryResult:
+        """
+        Deliver activity to several inboxes concurrently.
+        
+        When use_shared_inbox is set, inboxes on a host that advertises a
+        shared inbox are collapsed into one delivery to that shared inbox,
+        and the shared inbox URL is reported in the result.
+        At most max_concurrent deliveries are in flight at once.
+        """
+        # Drop repeated inboxes, keeping first-seen order
+        inbox_urls = list(dict.fromkeys(inbox_urls))
+        
+        if use_shared_inbox:
+            host_inboxes = await self._coalesce(inbox_urls)
+            inbox_urls = [
+                inbox_url
+                for inboxes in host_inboxes.values()
+                for inbox_url in inboxes
+            ]
+            
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+        
+        async def deliver(inbox_url: str) -> DeliveryResult:
+            async with semaphore:
+                return await self.deliver_to_inbox(
+                    activity,
+                    inbox_url,
+                    username
+                )
+                
+        delivery_results = await asyncio.gather(
+            *(deliver(inbox_url) for inbox_url in inbox_urls),
+            return_exceptions=True
+        )
+        
+        result = DeliveryResult()
+        for inbox_url, dr in zip(inbox_urls, delivery_results):
+            if isinstance(dr, DeliveryResult):
+                result.success.update(dr.success)
+                result.failed.update(dr.failed)
+                result.status_code = dr.status_code or result.status_code
+                result.error_message = dr.error_message or result.error_message
+            else:
+                result.failed.add(inbox_url)
+                result.error_message = str(dr)
+                
+        return result
+        
+    async def _coalesce(self, inbox_urls: List[str]) -> Dict[str, List[str]]:
+        """
+        Group inbox URLs by host.
+        
+        Hosts with a shared inbox map to just that shared inbox; other
+        hosts keep their individual inboxes.
+        """
+        host_inboxes = defaultdict(list)
+        for inbox_url in inbox_urls:
+            host_inboxes[urlparse(inbox_url).netloc].append(inbox_url)
+            
+        async def shared_inbox(domain: str) -> Optional[str]:
+            cached = await self._shared_inboxes.get(domain)
+            if cached is not None:
+                return cached or None
+            try:
+                instance_info = await self.discovery.discover_instance(domain)
+                shared = instance_info.shared_inbox if instance_info else None
+            except Exception as e:
+                logger.debug("No shared inbox for %s: %s", domain, e)
+                shared = None
+            await self._shared_inboxes.set(domain, shared or "")
+            return shared
+            
+        shared_inboxes = await asyncio.gather(
+            *(shared_inbox(domain) for domain in host_inboxes)
+        )
+        for domain, shared in zip(list(host_inboxes), shared_inboxes):
+            if shared:
+                host_inboxes[domain] = [shared]
+                
+        return dict(host_inboxes)
+        
     async def deliver_to_shared_inbox(
         self,
         activity: Dict[str, Any],
@@ -199,8 +403,8 @@ class ActivityDelivery:
                         delivery_results = await asyncio.gather(*tasks, return_exceptions=True)
                         for dr in delivery_results:
                             if isinstance(dr, DeliveryResult):
-                                result.success.extend(dr.success)
-                                result.failed.extend(dr.failed)
+                                result.success.update(dr.success)
+                                result.failed.update(dr.failed)
                         tasks = []
                         
             # Handle remaining tasks
@@ -208,8 +412,8 @@ class ActivityDelivery:
                 delivery_results = await asyncio.gather(*tasks, return_exceptions=True)
                 for dr in delivery_results:
                     if isinstance(dr, DeliveryResult):
-                        result.success.extend(dr.success)
-                        result.failed.extend(dr.failed)
+                        result.success.update(dr.success)
+                        result.failed.update(dr.failed)
                         
         except Exception as e:
             logger.error(f"Failed to deliver to shared inboxes: {e}")
@@ -233,7 +437,7 @@ class ActivityDelivery:
         except Exception as e:
             logger.error(f"Failed to deliver to actor {actor_id}: {e}")
             return DeliveryResult(
-                failed=[actor_id],
+                failed={actor_id},
                 error_message=str(e)
             )
             
@@ -248,8 +452,7 @@ class ActivityDelivery:
             session = await self._get_session()
             async with session.get(
                 url,
-                headers=headers,
-                timeout=self.timeout
+                headers=headers
             ) as response:
                 if response.status == 200:
                     return await response.json()
@@ -262,6 +465,16 @@ class ActivityDelivery:
             raise DeliveryError(f"Failed to fetch resource: {e}")
             
     async def close(self) -> None:
-        """Close HTTP session."""
+        """Stop delivery workers and close HTTP session."""
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        
+        if self._queue is not None:
+            while not self._queue.empty():
+                self._queue.get_nowait().future.cancel()
+            self._queue = None
+            
         if self.session and not self.session.closed:
             await self.session.close()
\ No newline at end of file
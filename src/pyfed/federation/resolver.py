@@ -4,12 +4,14 @@ ActivityPub resolver implementation.
 """
 
 from typing import Dict, Any, Optional
+import asyncio
 import aiohttp
 from urllib.parse import urlparse
 
 from ..utils.exceptions import ResolverError
 from ..utils.logging import get_logger
 from ..cache.actor_cache import ActorCache
+from ..cache.memory_cache import MemoryCache, parse_max_age
 from .webfinger import WebFingerClient
 
 logger = get_logger(__name__)
@@ -24,29 +26,43 @@ class ActivityPubResolver:
         Initialize resolver.
         
         Args:
-            actor_cache: Optional actor cache
+            actor_cache: Optional actor cache, defaults to an in-memory
+                LRU cache honouring Cache-Control max-age
             discovery_service: Optional WebFinger service
         """
-        self.actor_cache = actor_cache
+        self.actor_cache = actor_cache or ActorCache(MemoryCache(maxsize=10_000))
         self.discovery_service = discovery_service
+        self._pending: Dict[str, asyncio.Task] = {}
 
     async def resolve_actor(self, actor_id: str) -> Optional[Dict[str, Any]]:
         """
         Resolve an actor by ID or account.
         
+        Concurrent calls for the same actor share one in-flight lookup.
+        
         Args:
             actor_id: Actor ID or account (user@domain)
             
         Returns:
             Actor data or None if not found
         """
+        cached = await self.actor_cache.get(actor_id)
+        if cached:
+            return cached
+
+        # The lookup runs in its own task so that cancelling any one caller,
+        # including the first, doesn't cancel the result the others share
+        pending = self._pending.get(actor_id)
+        if pending is None:
+            pending = asyncio.ensure_future(self._resolve_actor(actor_id))
+            self._pending[actor_id] = pending
+            pending.add_done_callback(lambda _: self._pending.pop(actor_id, None))
+        return await asyncio.shield(pending)
+
+    async def _resolve_actor(self, actor_id: str) -> Optional[Dict[str, Any]]:
+        """Look up an actor without coalescing."""
+        requested_id = actor_id
         try:
-            # Check cache first
-            if self.actor_cache:
-                cached = await self.actor_cache.get(actor_id)
-                if cached:
-                    return cached
-
             # Try WebFinger if it's an account
             if '@' in actor_id and self.discovery_service:
                 actor_url = await self.discovery_service.get_actor_url(actor_id)
@@ -69,9 +85,12 @@ class ActivityPubResolver:
 
                     actor_data = await response.json()
 
-                    # Cache the result
-                    if self.actor_cache:
-                        await self.actor_cache.set(actor_id, actor_data)
+                    # Cache the result for as long as the origin allows
+                    ttl = parse_max_age(response.headers.get("Cache-Control"))
+                    if ttl != 0:
+                        await self.actor_cache.set(actor_id, actor_data, ttl)
+                        if requested_id != actor_id:
+                            await self.actor_cache.set(requested_id, actor_data, ttl)
 
                     return actor_data
 
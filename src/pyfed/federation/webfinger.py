@@ -7,13 +7,17 @@ import aiohttp
 from urllib.parse import quote
 import logging
 
+from ..cache.memory_cache import parse_max_age
+from ..cache.webfinger_cache import WebFingerCache
+
 logger = logging.getLogger(__name__)
 
 class WebFingerClient:
     """WebFinger client implementation."""
 
-    def __init__(self, verify_ssl: bool = True):
+    def __init__(self, verify_ssl: bool = True, cache: Optional[WebFingerCache] = None):
         self.verify_ssl = verify_ssl
+        self.cache = cache or WebFingerCache()
         self.session = None
 
     async def initialize(self) -> None:
@@ -42,6 +46,10 @@ class WebFingerClient:
             if not account.startswith('acct:'):
                 account = f"acct:{account}"
 
+            cached = await self.cache.get(account)
+            if cached:
+                return cached
+
             domain = account.split('@')[-1]
             url = f"https://{domain}/.well-known/webfinger?resource={quote(account)}"
 
@@ -49,7 +57,12 @@ class WebFingerClient:
             async with response as resp:
                 if resp.status != 200:
                     return None
-                return await resp.json()
+                data = await resp.json()
+
+                ttl = parse_max_age(resp.headers.get("Cache-Control"))
+                if ttl != 0:
+                    await self.cache.set(account, data, ttl)
+                return data
 
         except Exception as e:
             logger.error(f"WebFinger lookup failed for {account}: {e}")
@@ -1,24 +1,80 @@
-from typing import Union
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
-# from .base import APBase, APObject, APLink, APActivity
-from .actors import (
-    APActor, APPerson, APGroup, APOrganization, APApplication, APService
-)
-from .objects import (
-    APEvent, APPlace, APProfile, APRelationship, APTombstone,
-    APArticle, APAudio, APDocument, APImage, APNote, APPage, APVideo, APObject
-)
-from .collections import (
-    APCollection, APOrderedCollection, APCollectionPage, APOrderedCollectionPage
-)
-from .activities import (
-    APCreate, APUpdate, APDelete,
-    APFollow, APUndo, APLike, APAnnounce, APActivity, APAccept, APRemove, APBlock, APReject
+if TYPE_CHECKING:
+    from .actors import (
+        APActor, APPerson, APGroup, APOrganization, APApplication, APService
+    )
+    from .objects import (
+        APEvent, APPlace, APProfile, APRelationship, APTombstone,
+        APArticle, APAudio, APDocument, APImage, APNote, APPage, APVideo, APObject
+    )
+    from .collections import (
+        APCollection, APOrderedCollection, APCollectionPage, APOrderedCollectionPage
+    )
+    from .activities import (
+        APCreate, APUpdate, APDelete,
+        APFollow, APUndo, APLike, APAnnounce, APActivity, APAccept, APRemove, APBlock, APReject
+    )
+    from .links import APLink, APMention
+
+# Submodules are imported on first attribute access (PEP 562), so importing
+# one model does not build the schemas of every other model
+_EXPORTS = {
+    '.actors': (
+        'APActor', 'APPerson', 'APGroup', 'APOrganization', 'APApplication', 'APService'
+    ),
+    '.objects': (
+        'APEvent', 'APPlace', 'APProfile', 'APRelationship', 'APTombstone',
+        'APArticle', 'APAudio', 'APDocument', 'APImage', 'APNote', 'APPage', 'APVideo', 'APObject'
+    ),
+    '.collections': (
+        'APCollection', 'APOrderedCollection', 'APCollectionPage', 'APOrderedCollectionPage'
+    ),
+    '.activities': (
+        'APCreate', 'APUpdate', 'APDelete',
+        'APFollow', 'APUndo', 'APLike', 'APAnnounce', 'APActivity', 'APAccept', 'APRemove', 'APBlock', 'APReject'
+    ),
+    '.links': ('APLink', 'APMention'),
+}
+_MODULE_BY_NAME = {
+    name: module for module, names in _EXPORTS.items() for name in names
+}
+
+# Concrete model for each ActivityStreams type
+_TYPE_MAP_CLASSES = (
+    'APPerson', 'APGroup', 'APOrganization', 'APApplication', 'APService',
+    'APEvent', 'APPlace', 'APProfile', 'APRelationship', 'APTombstone',
+    'APArticle', 'APAudio', 'APDocument', 'APImage', 'APNote', 'APPage', 'APVideo',
+    'APCollection', 'APOrderedCollection', 'APCollectionPage', 'APOrderedCollectionPage',
+    'APCreate', 'APUpdate', 'APDelete', 'APFollow', 'APUndo', 'APLike', 'APAnnounce',
+    'APAccept', 'APRemove', 'APBlock', 'APReject',
+    'APLink', 'APMention'
 )
-from .links import APLink, APMention
+
+def __getattr__(name: str) -> Any:
+    if name in _MODULE_BY_NAME:
+        value = getattr(importlib.import_module(_MODULE_BY_NAME[name], __name__), name)
+    elif name == 'AP_TYPE_MAP':
+        value = {
+            cls.model_fields['type'].default: cls
+            for cls in map(__getattr__, _TYPE_MAP_CLASSES)
+        }
+    elif name == 'AP_OBJECT_LIST_ADAPTER':
+        # Reusable validator for bulk item lists, e.g. collection page items
+        from pydantic import TypeAdapter
+        value = TypeAdapter(List[__getattr__('APObject')])
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
 
 # Export all classes
 __all__ = [
+    'AP_TYPE_MAP', 'AP_OBJECT_LIST_ADAPTER',
     'APBase', 'APObject', 'APLink', 'APActivity',
     'APActor', 'APPerson', 'APGroup', 'APOrganization', 'APApplication', 'APService',
     'APEvent', 'APPlace', 'APProfile', 'APRelationship', 'APTombstone', 'APArticle', 'APAudio', 'APDocument', 'APImage', 'APNote', 'APPage', 'APVideo',
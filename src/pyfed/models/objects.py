@@ -7,9 +7,11 @@ For more information, see:
 https://www.w3.org/TR/activitystreams-vocabulary/
 """
 
+from functools import cached_property
+
 from ..serializers.json_serializer import ActivityPubBase
 from pydantic import Field, HttpUrl, field_validator, model_validator
-from typing import Optional, List, Union, Literal, Dict
+from typing import Optional, List, Union, Literal, Dict, Any
 from datetime import datetime
 from pyfed.models.links import APLink
 
@@ -110,9 +112,20 @@ class APObject(ActivityPubBase):
             if isinstance(tag, dict) and tag.get('type') == "Mention"
         ]
 
-    def __str__(self):
+    @cached_property
+    def id_str(self) -> str:
+        """The object's id as a plain string, converted once per instance."""
         return str(self.id)
 
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> 'APObject':
+        """Copy the model, dropping a cached id string that may no longer match."""
+        copied = super().model_copy(update=update, deep=deep)
+        copied.__dict__.pop('id_str', None)
+        return copied
+
+    def __str__(self):
+        return self.id_str
+
 class APEvent(APObject):
     """Event object as defined in ActivityStreams 2.0.
     
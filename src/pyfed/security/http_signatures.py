@@ -173,7 +173,7 @@ class HTTPSignatureVerifier:
         method: str,
         path: str,
         headers: Dict[str, str],
-        body: Optional[Dict[str, Any]] = None,
+        body: Optional[Union[Dict[str, Any], bytes]] = None,
         username: Optional[str] = None
     ) -> Dict[str, str]:
         """Sign HTTP request."""
@@ -207,12 +207,12 @@ class HTTPSignatureVerifier:
 
             # Get private key
             if self.key_manager:
-                private_key = await self.key_manager.get_active_private_key()
+                # One lookup gives both the parsed key and its ID
                 active_key = await self.key_manager.get_active_key()
-                if active_key:
-                    key_id = active_key.key_id
-                else:
+                if not active_key:
                     raise SignatureError("No active key available")
+                private_key = active_key.private_key
+                key_id = active_key.key_id
             else:
                 private_key = self.private_key
                 key_id = self.key_id
@@ -329,19 +329,21 @@ class HTTPSignatureVerifier:
             logger.error(f"Signed headers: {signed_headers}")
             raise SignatureError(f"Failed to build signing string: {e}")
 
-    def _generate_digest(self, body: Dict[str, Any]) -> str:
+    def _generate_digest(self, body: Union[Dict[str, Any], bytes]) -> str:
         """
         Generate digest header value for request body.
         
         Args:
-            body: Request body as dictionary
+            body: Request body as dictionary or already serialized bytes
             
         Returns:
             Digest header value
         """
-        # Use standardized JSON serialization
-        body_json = ActivityPubSerializer.to_json_string(body)
-        body_bytes = body_json.encode('utf-8')
+        # Use the same canonical bytes that are sent as the body
+        if isinstance(body, bytes):
+            body_bytes = body
+        else:
+            body_bytes = ActivityPubSerializer.to_json_bytes(body)
         
         # Calculate SHA-256 digest
         digest = hashlib.sha256(body_bytes).digest()
@@ -49,28 +49,71 @@ class KeyManager:
     def __init__(
         self,
         domain: str,
-        keys_path: str,
+        keys_path: Optional[str],
         rotation_config: Optional[Dict[str, Any]] = None
     ):
-        """Initialize key manager."""
+        """
+        Initialize key manager.
+        
+        With keys_path set to None, keys are kept in memory only.
+        """
         self.domain = domain
-        self.keys_path = Path(keys_path)
+        self.keys_path = Path(keys_path) if keys_path is not None else None
         self.rotation_config = rotation_config or KeyRotation()
         self.active_keys: Dict[str, KeyPair] = {}
         self._rotation_task = None
 
+    @classmethod
+    def from_keypair(
+        cls,
+        domain: str,
+        private_key_pem: bytes,
+        public_key_pem: Optional[bytes] = None,
+        rotation_config: Optional[KeyRotation] = None
+    ) -> 'KeyManager':
+        """Create an in-memory key manager around an existing key pair."""
+        try:
+            key_manager = cls(domain, None, rotation_config)
+            private_key = serialization.load_pem_private_key(
+                private_key_pem,
+                password=None
+            )
+            public_key = (
+                serialization.load_pem_public_key(public_key_pem)
+                if public_key_pem is not None
+                else private_key.public_key()
+            )
+            
+            created_at = datetime.utcnow()
+            key_pair = KeyPair(
+                private_key=private_key,
+                public_key=public_key,
+                created_at=created_at,
+                expires_at=created_at + timedelta(
+                    days=key_manager.rotation_config.rotation_interval
+                ),
+                key_id=f"https://{domain}/keys/{int(created_at.timestamp())}"
+            )
+            key_manager.active_keys[key_pair.key_id] = key_pair
+            return key_manager
+            
+        except Exception as e:
+            logger.error(f"Failed to load key pair: {e}")
+            raise KeyManagementError(f"Failed to load key pair: {e}")
+
     async def initialize(self) -> None:
         """Initialize key manager."""
         try:
             logger.info(f"Initializing key manager with path: {self.keys_path}")
             
-            # Create keys directory
-            self.keys_path.mkdir(parents=True, exist_ok=True)
-            logger.info("Created keys directory")
-            
-            # Load existing keys
-            await self._load_existing_keys()
-            logger.info(f"Loaded {len(self.active_keys)} existing keys")
+            if self.keys_path is not None:
+                # Create keys directory
+                self.keys_path.mkdir(parents=True, exist_ok=True)
+                logger.info("Created keys directory")
+                
+                # Load existing keys
+                await self._load_existing_keys()
+                logger.info(f"Loaded {len(self.active_keys)} existing keys")
             
             # Generate initial keys if none exist
             if not self.active_keys:
@@ -246,6 +289,8 @@ class KeyManager:
 
     async def _save_key_pair(self, key_pair: KeyPair, safe_path: str) -> None:
         """Save key pair to disk."""
+        if self.keys_path is None:
+            return
         try:
             # Save private key
             private_key_path = self.keys_path / f"{safe_path}_private.pem"
@@ -283,6 +328,8 @@ class KeyManager:
 
     async def _archive_key_pair(self, key_pair: KeyPair) -> None:
         """Archive an expired key pair."""
+        if self.keys_path is None:
+            return
         try:
             archive_dir = self.keys_path / "archive"
             archive_dir.mkdir(exist_ok=True)
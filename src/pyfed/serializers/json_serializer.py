@@ -6,7 +6,8 @@ from typing import Any, Dict, Union, List, Optional, Type, get_origin, get_args
 from datetime import datetime, timezone
 import json
 import re
-from pydantic import BaseModel, AnyUrl, HttpUrl
+import orjson
+from pydantic import BaseModel, AnyUrl, HttpUrl, ConfigDict
 from pydantic_core import Url
 
 def to_camel_case(snake_str: str) -> str:
@@ -103,6 +104,19 @@ class ActivityPubSerializer:
             separators=(',', ':')
         )
 
+    @staticmethod
+    def to_json_bytes(data: Dict[str, Any]) -> bytes:
+        """
+        Convert dictionary to canonical JSON bytes for request bodies.
+        
+        Args:
+            data: Dictionary to convert
+            
+        Returns:
+            UTF-8 JSON bytes with sorted keys
+        """
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+
     @staticmethod
     def serialize(obj: Any, include_context: bool = True) -> Dict[str, Any]:
         """
@@ -173,19 +187,31 @@ class ActivityPubSerializer:
         return value
 
     @staticmethod
-    def deserialize(data: Union[str, Dict[str, Any]], model_class: Type[BaseModel]) -> BaseModel:
+    def deserialize(
+        data: Union[str, bytes, Dict[str, Any]],
+        model_class: Optional[Type[BaseModel]] = None,
+        trusted: bool = False
+    ) -> BaseModel:
         """
         Deserialize data to object.
         
         Args:
-            data: JSON string or dictionary to deserialize
-            model_class: Class to deserialize into
+            data: JSON string, bytes or dictionary to deserialize
+            model_class: Class to deserialize into; looked up from the
+                data's type when omitted
+            trusted: Skip validation for data known to be valid, such as
+                output of serialize(); never set for remote input
             
         Returns:
             Deserialized object
         """
+        # JSON input with a known model parses and validates in one pass;
+        # camelCase keys match the model aliases and unknown keys are ignored
+        if isinstance(data, (str, bytes)) and model_class is not None and not trusted:
+            return model_class.model_validate_json(data)
+            
         # Handle JSON string input
-        if isinstance(data, str):
+        if isinstance(data, (str, bytes)):
             try:
                 data_dict = json.loads(data)
             except json.JSONDecodeError:
@@ -196,6 +222,12 @@ class ActivityPubSerializer:
         if not isinstance(data_dict, dict):
             raise ValueError("Data must be a dictionary or JSON string")
 
+        if model_class is None:
+            from ..models import AP_TYPE_MAP
+            model_class = AP_TYPE_MAP.get(data_dict.get('type'))
+            if model_class is None:
+                raise ValueError(f"Unknown type: {data_dict.get('type')}")
+
         # Make a copy of the data
         data_dict = dict(data_dict)
         
@@ -222,28 +254,54 @@ class ActivityPubSerializer:
             
             processed_data[snake_key] = processed_value
 
+        if trusted:
+            return model_class.model_construct(**processed_data)
+
         # Use model_validate instead of direct construction
         return model_class.model_validate(processed_data)
 
 class ActivityPubBase(BaseModel):
     """Base class for all ActivityPub objects."""
-    
+
     def serialize(self, include_context: bool = True) -> Dict[str, Any]:
         """Serialize object to dictionary."""
         return ActivityPubSerializer.serialize(self, include_context)
 
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize object to canonical JSON bytes.
+        
+        Models are frozen, so the bytes are computed once and kept on
+        the instance for later calls. They live in the instance __dict__
+        rather than a private attribute, which pydantic would include in
+        equality checks.
+        """
+        json_bytes = self.__dict__.get('_json_bytes')
+        if json_bytes is None:
+            json_bytes = ActivityPubSerializer.to_json_bytes(self.serialize())
+            self.__dict__['_json_bytes'] = json_bytes
+        return json_bytes
+
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> 'ActivityPubBase':
+        """Copy the model, dropping cached JSON that may no longer match."""
+        copied = super().model_copy(update=update, deep=deep)
+        copied.__dict__.pop('_json_bytes', None)
+        return copied
+
     @classmethod
-    def deserialize(cls, data: Union[str, Dict[str, Any]]) -> 'ActivityPubBase':
+    def deserialize(cls, data: Union[str, bytes, Dict[str, Any]]) -> 'ActivityPubBase':
         """Deserialize dictionary to object."""
         return ActivityPubSerializer.deserialize(data, cls)
 
-    class Config:
-        """Pydantic config."""
-        alias_generator = to_camel_case
-        populate_by_alias = True
-        extra = "allow"
-        arbitrary_types_allowed = True
-        populate_by_name = True
+    # Models are immutable once validated; no per-assignment validation
+    model_config = ConfigDict(
+        alias_generator=to_camel_case,
+        extra="ignore",
+        arbitrary_types_allowed=True,
+        populate_by_name=True,
+        frozen=True,
+        validate_assignment=False
+    )
 
 def to_json(obj: ActivityPubBase, **kwargs) -> str:
     """Convert object to JSON string."""
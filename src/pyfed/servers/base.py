@@ -148,11 +148,13 @@ class ActivityPubServer:
             
     async def get_actor_inbox(self, actor_id: str) -> List[Dict[str, Any]]:
         """Get actor's inbox contents."""
-        return await self.storage.get_inbox(actor_id)
+        activities, _ = await self.storage.get_inbox(actor_id)
+        return activities
         
     async def get_actor_outbox(self, actor_id: str) -> List[Dict[str, Any]]:
         """Get actor's outbox contents."""
-        return await self.storage.get_outbox(actor_id)
+        activities, _ = await self.storage.get_outbox(actor_id)
+        return activities
         
     async def get_followers(self, actor_id: str) -> List[str]:
         """Get actor's followers."""
@@ -7,7 +7,8 @@
 # - Storage provider protocol
 # """
 
-from .base import SQLStorageBackend
+from .base import BaseStorageBackend, StorageBackend
+from .sql import SQLStorageBackend
 # from .backends.postgresql import PostgreSQLStorage
 # from .backends.mongodb import MongoDBStorageBackend
 # from .backends.redis import RedisStorageBackend
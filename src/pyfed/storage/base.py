@@ -3,7 +3,7 @@ Base storage interface.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from enum import Enum
 
 from ..utils.exceptions import StorageError
@@ -91,4 +91,63 @@ class StorageBackend(ABC):
     @abstractmethod
     async def close(self) -> None:
         """Close storage connection."""
-        pass
\ No newline at end of file
+        pass
+
+class BaseStorageBackend(ABC):
+    """Abstract ActivityPub data store used by the server and handlers."""
+
+    @abstractmethod
+    async def initialize(self) -> None:
+        """Initialize storage."""
+        pass
+
+    @abstractmethod
+    async def create_activity(self, activity: Dict[str, Any]) -> str:
+        """Store an activity."""
+        pass
+
+    @abstractmethod
+    async def create_object(self, obj: Dict[str, Any]) -> str:
+        """Store an object."""
+        pass
+
+    @abstractmethod
+    async def create_actor(self, actor: Dict[str, Any]) -> str:
+        """Store an actor."""
+        pass
+
+    @abstractmethod
+    async def create_follow(self, follower: str, following: str) -> None:
+        """Store a follow relationship."""
+        pass
+
+    @abstractmethod
+    async def get_inbox(self,
+                        actor_id: str,
+                        limit: int = 20,
+                        cursor: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Get a page of an actor's inbox and the cursor for the next page."""
+        pass
+
+    @abstractmethod
+    async def get_outbox(self,
+                         actor_id: str,
+                         limit: int = 20,
+                         cursor: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Get a page of an actor's outbox and the cursor for the next page."""
+        pass
+
+    @abstractmethod
+    async def get_followers(self, actor_id: str) -> List[str]:
+        """Get IDs of an actor's followers."""
+        pass
+
+    @abstractmethod
+    async def get_following(self, actor_id: str) -> List[str]:
+        """Get IDs of actors an actor follows."""
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Close storage connection."""
+        pass
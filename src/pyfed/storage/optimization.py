@@ -2,7 +2,7 @@
 Storage optimization implementation.
 """
 
-from typing import Dict, Any, Optional, List, Type
+from typing import Dict, Any, Optional, List, Type, Protocol, Set
 from datetime import datetime
 import asyncio
 import asyncpg
@@ -16,17 +16,35 @@ from .base import StorageBackend
 
 logger = get_logger(__name__)
 
+class SharedQueryCache(Protocol):
+    """Shared (cross-process) cache layer, e.g. a Redis client."""
+
+    async def get(self, key: str) -> Optional[bytes]:
+        ...
+
+    async def set(self, key: str, value: bytes, ex: Optional[int] = None) -> Any:
+        ...
+
 class QueryOptimizer:
-    """Query optimization and caching."""
+    """
+    Query optimization and caching.
+
+    Results are cached in a per-process dict (L1). When a shared cache
+    (L2) is given, L1 misses fall back to it and new results are written
+    through to it, so workers can reuse each other's results.
+    """
 
     def __init__(self,
                  cache_ttl: int = 300,  # 5 minutes
-                 max_cache_size: int = 1000):
+                 max_cache_size: int = 1000,
+                 shared_cache: Optional[SharedQueryCache] = None):
         self.cache_ttl = cache_ttl
         self.max_cache_size = max_cache_size
+        self.shared_cache = shared_cache
         self.query_cache: Dict[str, Dict[str, Any]] = {}
         self.query_stats: Dict[str, Dict[str, int]] = {}
         self._cleanup_task = None
+        self._pending_writes: Set[asyncio.Task] = set()
 
     async def initialize(self) -> None:
         """Initialize optimizer."""
@@ -77,11 +95,61 @@ class QueryOptimizer:
             entry = self.query_cache[cache_key]
             if datetime.utcnow().timestamp() < entry['expires']:
                 return entry['result']
-        return None
+
+        if self.shared_cache is None:
+            return None
+
+        try:
+            data = await self.shared_cache.get(self._shared_key(cache_key))
+        except Exception as e:
+            logger.error(f"Shared cache lookup failed: {e}")
+            return None
+        if data is None:
+            return None
+
+        try:
+            result = json.loads(data)
+        except ValueError as e:
+            logger.error(f"Invalid shared cache entry: {e}")
+            return None
+        self._store_local(cache_key, result)
+        return result
 
     async def cache_result(self, query: str, params: tuple, result: Any) -> None:
         """Cache query result."""
         cache_key = f"{query}:{params}"
+        self._store_local(cache_key, result)
+
+        if self.shared_cache is not None:
+            # Write through to the shared layer without blocking the caller
+            task = asyncio.create_task(self._write_shared(cache_key, result))
+            self._pending_writes.add(task)
+            task.add_done_callback(self._pending_writes.discard)
+
+    def _shared_key(self, cache_key: str) -> str:
+        """Get key used in the shared cache."""
+        return f"query:{cache_key}"
+
+    async def _write_shared(self, cache_key: str, result: Any) -> None:
+        """Write result to the shared cache."""
+        try:
+            # No default= fallback: results that are not JSON-native would
+            # come back from L2 as strings, so they stay process-local.
+            data = json.dumps(result).encode()
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Result not cached in shared cache: {e}")
+            return
+        try:
+            await self.shared_cache.set(
+                self._shared_key(cache_key),
+                data,
+                ex=self.cache_ttl
+            )
+        except Exception as e:
+            logger.error(f"Shared cache write failed: {e}")
+
+    def _store_local(self, cache_key: str, result: Any) -> None:
+        """Store result in the per-process cache."""
         expires = datetime.utcnow().timestamp() + self.cache_ttl
         
         # Manage cache size
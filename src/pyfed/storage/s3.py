@@ -1,6 +1,7 @@
 from typing import Union, BinaryIO, Dict, Any, Optional
 from pathlib import Path
 import aioboto3
+from botocore.exceptions import ClientError
 from datetime import datetime
 import io
 import mimetypes
@@ -8,6 +9,13 @@ import json
 
 from .backend import StorageBackend
 
+# Error codes S3 (and S3-compatible services) use for a missing key
+NOT_FOUND_CODES = frozenset({'404', 'NoSuchKey', 'NotFound'})
+
+def _is_not_found(error: ClientError) -> bool:
+    """Check whether a ClientError means the object does not exist."""
+    return error.response.get('Error', {}).get('Code') in NOT_FOUND_CODES
+
 class S3StorageBackend:
     """S3-compatible storage backend implementation."""
     
@@ -15,6 +23,7 @@ class S3StorageBackend:
         self.session = None
         self.bucket = None
         self.prefix = None
+        self._path_prefix = ''
         self.client = None
         
     async def initialize(self, config: Dict[str, Any]) -> None:
@@ -26,6 +35,8 @@ class S3StorageBackend:
         self.bucket = config['bucket']
         self.prefix = config.get('prefix', '')
         self.endpoint_url = config.get('endpoint_url')  # For compatibility with other S3-compatible services
+        # Normalize the prefix once rather than on every path lookup
+        self._path_prefix = f"{self.prefix.rstrip('/')}/" if self.prefix else ''
         
     async def _get_client(self):
         """Get or create S3 client."""
@@ -35,7 +46,7 @@ class S3StorageBackend:
         
     def _get_full_path(self, path: str) -> str:
         """Get full S3 path including prefix."""
-        return f"{self.prefix.rstrip('/')}/{path.lstrip('/')}" if self.prefix else path
+        return self._path_prefix + path.lstrip('/') if self._path_prefix else path
         
     async def store_file(self,
                         file_data: Union[bytes, BinaryIO, Path],
@@ -110,9 +121,10 @@ class S3StorageBackend:
                     Bucket=self.bucket,
                     Key=full_path
                 )
-            except Exception as e:
+            except ClientError as e:
                 # Ignore if file doesn't exist
-                pass
+                if not _is_not_found(e):
+                    raise
                 
     async def file_exists(self, path: str) -> bool:
         """Check if a file exists in S3 storage."""
@@ -128,8 +140,10 @@ class S3StorageBackend:
                     Key=full_path
                 )
                 return True
-            except:
-                return False
+            except ClientError as e:
+                if _is_not_found(e):
+                    return False
+                raise
                 
     async def get_file_metadata(self, path: str) -> Dict[str, Any]:
         """Get metadata for a stored file."""
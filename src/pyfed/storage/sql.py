@@ -4,15 +4,15 @@ SQL storage backend for ActivityPub data.
 
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
-import json
 import enum
+import orjson
 import sqlalchemy as sa
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker, declarative_base, relationship
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import declarative_base, relationship
 from sqlalchemy.future import select
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, insert as pg_insert
 from sqlalchemy.sql.expression import and_, or_
-from sqlalchemy import Index, UniqueConstraint, event
+from sqlalchemy import Index, UniqueConstraint, event, union_all
 
 from .base import BaseStorageBackend
 from ..utils.exceptions import StorageError
@@ -20,6 +20,10 @@ from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+def _json_dumps(value: Any) -> str:
+    """Serialize a JSONB value; asyncpg expects text for JSONB parameters."""
+    return orjson.dumps(value).decode()
+
 Base = declarative_base()
 
 class ActivityType(enum.Enum):
@@ -50,12 +54,22 @@ class ObjectType(enum.Enum):
     COLLECTION = "Collection"
     ORDERED_COLLECTION = "OrderedCollection"
 
+def _id_of(data: Dict[str, Any], key: str) -> Optional[str]:
+    """Get the ID of a referenced object, given either embedded or as a URI."""
+    value = data.get(key)
+    return value.get('id') if isinstance(value, dict) else value
+
+def _type_check(enum_cls: type, name: str) -> sa.CheckConstraint:
+    """Restrict a plain string type column to the values of an enum."""
+    values = ', '.join(f"'{member.value}'" for member in enum_cls)
+    return sa.CheckConstraint(f"type IN ({values})", name=name)
+
 class Activity(Base):
     """Activity table with enhanced indexing and relationships."""
     __tablename__ = 'activities'
     
     id = sa.Column(sa.String, primary_key=True)
-    type = sa.Column(sa.Enum(ActivityType), nullable=False)
+    type = sa.Column(sa.String(32), nullable=False)
     actor = sa.Column(sa.String, sa.ForeignKey('actors.id'), nullable=False)
     object_id = sa.Column(sa.String, sa.ForeignKey('objects.id'), nullable=True)
     target_id = sa.Column(sa.String, sa.ForeignKey('objects.id'), nullable=True)
@@ -64,20 +78,34 @@ class Activity(Base):
     visibility = sa.Column(sa.String, default='public')
     created_at = sa.Column(sa.DateTime, default=datetime.utcnow)
     
-    # Relationships
-    actor_obj = relationship("Actor", back_populates="activities")
-    object = relationship("Object", foreign_keys=[object_id])
-    target = relationship("Object", foreign_keys=[target_id])
+    # Relationships (lazy="raise" so accidental per-row loads fail loudly;
+    # use selectinload() where related rows are needed)
+    actor_obj = relationship("Actor", back_populates="activities", lazy="raise")
+    object = relationship("Object", foreign_keys=[object_id], lazy="raise")
+    target = relationship("Object", foreign_keys=[target_id], lazy="raise")
     
     # Indexes
     __table_args__ = (
+        _type_check(ActivityType, 'ck_activities_type'),
         Index('idx_activities_type', 'type'),
         Index('idx_activities_actor', 'actor'),
         Index('idx_activities_object', 'object_id'),
         Index('idx_activities_target', 'target_id'),
         Index('idx_activities_created', 'created_at'),
+        Index('idx_activities_created_id', created_at.desc(), id.desc()),
         Index('idx_activities_visibility', 'visibility'),
         Index('idx_activities_local', 'local'),
+        Index('idx_activities_actor_created', 'actor', created_at.desc(), id.desc()),
+        Index(
+            'idx_activities_actor_public_created',
+            'actor', created_at.desc(), id.desc(),
+            postgresql_where=visibility == 'public'
+        ),
+        Index(
+            'idx_activities_target_inbox',
+            'target_id', created_at.desc(), id.desc(),
+            postgresql_where=visibility.in_(['public', 'followers'])
+        ),
     )
 
 class Object(Base):
@@ -85,30 +113,41 @@ class Object(Base):
     __tablename__ = 'objects'
     
     id = sa.Column(sa.String, primary_key=True)
-    type = sa.Column(sa.Enum(ObjectType), nullable=False)
+    type = sa.Column(sa.String(32), nullable=False)
     attributed_to = sa.Column(sa.String, sa.ForeignKey('actors.id'), nullable=True)
     data = sa.Column(JSONB, nullable=False)
     local = sa.Column(sa.Boolean, default=False)
     visibility = sa.Column(sa.String, default='public')
     content = sa.Column(sa.Text, nullable=True)  # Extracted content for search
+    content_tsv = sa.Column(
+        TSVECTOR,
+        sa.Computed("to_tsvector('simple', coalesce(content, ''))", persisted=True)
+    )
     created_at = sa.Column(sa.DateTime, default=datetime.utcnow)
     updated_at = sa.Column(sa.DateTime, onupdate=datetime.utcnow)
     deleted_at = sa.Column(sa.DateTime, nullable=True)
     
     # Relationships
-    attributed_to_actor = relationship("Actor", back_populates="objects")
-    activities_as_object = relationship("Activity", foreign_keys=[Activity.object_id])
-    activities_as_target = relationship("Activity", foreign_keys=[Activity.target_id])
+    attributed_to_actor = relationship("Actor", back_populates="objects", lazy="raise")
+    activities_as_object = relationship("Activity", foreign_keys=[Activity.object_id], lazy="raise")
+    activities_as_target = relationship("Activity", foreign_keys=[Activity.target_id], lazy="raise")
     
     # Indexes
     __table_args__ = (
+        _type_check(ObjectType, 'ck_objects_type'),
         Index('idx_objects_type', 'type'),
         Index('idx_objects_attributed', 'attributed_to'),
         Index('idx_objects_created', 'created_at'),
         Index('idx_objects_updated', 'updated_at'),
         Index('idx_objects_visibility', 'visibility'),
         Index('idx_objects_local', 'local'),
-        Index('idx_objects_content', 'content', postgresql_using='gin'),
+        Index('idx_objects_content_tsv', 'content_tsv', postgresql_using='gin'),
+        Index(
+            'idx_objects_data_gin',
+            'data',
+            postgresql_using='gin',
+            postgresql_ops={'data': 'jsonb_path_ops'}
+        ),
     )
 
 class Actor(Base):
@@ -116,7 +155,7 @@ class Actor(Base):
     __tablename__ = 'actors'
     
     id = sa.Column(sa.String, primary_key=True)
-    type = sa.Column(sa.Enum(ObjectType), nullable=False)
+    type = sa.Column(sa.String(32), nullable=False)
     username = sa.Column(sa.String)
     domain = sa.Column(sa.String, nullable=False)
     inbox_url = sa.Column(sa.String)
@@ -132,13 +171,14 @@ class Actor(Base):
     last_fetched_at = sa.Column(sa.DateTime, nullable=True)
     
     # Relationships
-    activities = relationship("Activity", back_populates="actor_obj")
-    objects = relationship("Object", back_populates="attributed_to_actor")
-    followers = relationship("Follow", foreign_keys="Follow.following", back_populates="following_actor")
-    following = relationship("Follow", foreign_keys="Follow.follower", back_populates="follower_actor")
+    activities = relationship("Activity", back_populates="actor_obj", lazy="raise")
+    objects = relationship("Object", back_populates="attributed_to_actor", lazy="raise")
+    followers = relationship("Follow", foreign_keys="Follow.following", back_populates="following_actor", lazy="raise")
+    following = relationship("Follow", foreign_keys="Follow.follower", back_populates="follower_actor", lazy="raise")
     
     # Indexes and constraints
     __table_args__ = (
+        _type_check(ObjectType, 'ck_actors_type'),
         UniqueConstraint('username', 'domain', name='uq_actor_username_domain'),
         Index('idx_actors_username_domain', 'username', 'domain'),
         Index('idx_actors_domain', 'domain'),
@@ -158,14 +198,27 @@ class Follow(Base):
     accepted_at = sa.Column(sa.DateTime, nullable=True)
     
     # Relationships
-    follower_actor = relationship("Actor", foreign_keys=[follower], back_populates="following")
-    following_actor = relationship("Actor", foreign_keys=[following], back_populates="followers")
+    follower_actor = relationship("Actor", foreign_keys=[follower], back_populates="following", lazy="raise")
+    following_actor = relationship("Actor", foreign_keys=[following], back_populates="followers", lazy="raise")
     
     # Indexes and constraints
     __table_args__ = (
         UniqueConstraint('follower', 'following', name='uq_follow_relationship'),
-        Index('idx_follows_follower', 'follower'),
-        Index('idx_follows_following', 'following'),
+        # Partial indexes: follow queries almost always filter accepted follows.
+        # Rows are kept in page order and include the other side of the
+        # relationship, so collection pages are index-only scans.
+        Index(
+            'idx_follows_follower_accepted',
+            'follower', created_at.desc(), id.desc(),
+            postgresql_include=['following'],
+            postgresql_where=accepted == True
+        ),
+        Index(
+            'idx_follows_following_accepted',
+            'following', created_at.desc(), id.desc(),
+            postgresql_include=['follower'],
+            postgresql_where=accepted == True
+        ),
         Index('idx_follows_accepted', 'accepted'),
     )
 
@@ -179,15 +232,120 @@ class Like(Base):
     created_at = sa.Column(sa.DateTime, default=datetime.utcnow)
     
     # Relationships
-    actor = relationship("Actor")
-    object = relationship("Object")
+    actor = relationship("Actor", lazy="raise")
+    object = relationship("Object", lazy="raise")
     
     # Indexes and constraints
     __table_args__ = (
         UniqueConstraint('actor_id', 'object_id', name='uq_like_relationship'),
         Index('idx_likes_actor', 'actor_id'),
-        Index('idx_likes_object', 'object_id'),
+        Index(
+            'idx_likes_object',
+            'object_id', created_at.desc(), id.desc(),
+            postgresql_include=['actor_id']
+        ),
+    )
+
+# Batches larger than this are written with COPY instead of INSERT
+COPY_THRESHOLD = 500
+
+# Hot read statements are built once; callers bind `actor_id` per execution
+_FOLLOWERS_STMT = select(Follow.follower).where(
+    and_(
+        Follow.following == sa.bindparam('actor_id'),
+        Follow.accepted == True
+    )
+)
+
+_FOLLOWING_STMT = select(Follow.following).where(
+    and_(
+        Follow.follower == sa.bindparam('actor_id'),
+        Follow.accepted == True
     )
+)
+
+_ACTOR_STATS_STMT = select(
+    select(sa.func.count()).where(
+        and_(
+            Follow.following == sa.bindparam('actor_id'),
+            Follow.accepted == True
+        )
+    ).scalar_subquery().label('followers_count'),
+    select(sa.func.count()).where(
+        and_(
+            Follow.follower == sa.bindparam('actor_id'),
+            Follow.accepted == True
+        )
+    ).scalar_subquery().label('following_count'),
+    select(sa.func.count()).where(
+        and_(
+            Activity.actor == sa.bindparam('actor_id'),
+            Activity.type == ActivityType.CREATE.value
+        )
+    ).scalar_subquery().label('posts_count')
+)
+
+# Rendered inline rather than bound so that prepared (generic) plans can
+# still prove the WHERE clauses of the partial indexes
+# idx_activities_actor_public_created and idx_activities_target_inbox
+_PUBLIC = sa.literal_column("'public'")
+_INBOX_VISIBILITY = (_PUBLIC, sa.literal_column("'followers'"))
+
+def _newest_first(entity):
+    """Ordering for paginated queries; ties on created_at are broken by id."""
+    return (entity.created_at.desc(), entity.id.desc())
+
+def _page_columns(entity, data=None):
+    """
+    Columns selected for paginated reads: the payload plus the cursor key.
+    Selecting columns instead of the mapped class skips ORM hydration.
+    """
+    if data is None:
+        data = entity.data
+    return (entity.id, entity.created_at, data.label('data'))
+
+def _inbox_query(actor_id: str, limit: int, *criteria):
+    """
+    Build query for activities in an actor's inbox, newest first.
+
+    The two inbox conditions are queried separately and combined with
+    UNION ALL instead of OR, so each side is an ordered, limited range
+    scan on its own index rather than a BitmapOr with a heap recheck.
+    The first branch excludes the actor's own activities, which the
+    second branch already returns.
+    """
+    targeted = select(*_page_columns(Activity)).where(
+        Activity.target_id == actor_id,
+        Activity.visibility.in_(_INBOX_VISIBILITY),
+        Activity.actor != actor_id,
+        *criteria
+    ).order_by(*_newest_first(Activity)).limit(limit)
+    
+    own = select(*_page_columns(Activity)).where(
+        Activity.actor == actor_id,
+        *criteria
+    ).order_by(*_newest_first(Activity)).limit(limit)
+    
+    inbox = union_all(targeted, own).subquery()
+    return select(*_page_columns(inbox.c)).order_by(*_newest_first(inbox.c)).limit(limit)
+
+def _outbox_query(actor_id: str, limit: int, *criteria):
+    """Build query for public activities in an actor's outbox, newest first."""
+    return select(*_page_columns(Activity)).where(
+        Activity.actor == actor_id,
+        Activity.visibility == _PUBLIC,
+        *criteria
+    ).order_by(*_newest_first(Activity)).limit(limit)
+
+def _parse_cursor(cursor: str, model) -> Tuple[datetime, Any]:
+    """Parse a `created_at|id` collection cursor."""
+    try:
+        created_at, item_id = cursor.split('|', 1)
+        if model.__table__.c.id.type.python_type is int:
+            item_id = int(item_id)
+        return datetime.fromisoformat(created_at), item_id
+    except ValueError as e:
+        raise StorageError(f"Invalid collection cursor: {cursor}") from e
 
 class SQLStorageBackend(BaseStorageBackend):
     """SQL storage backend implementation with enhanced features."""
@@ -196,100 +354,166 @@ class SQLStorageBackend(BaseStorageBackend):
         """Initialize storage backend."""
         self.database_url = database_url
         self.engine = None
+        self.read_engine = None
         self.async_session = None
         
     async def initialize(self) -> None:
-        """Initialize database connection."""
+        """
+        Initialize database connection.
+
+        The pool settings assume database_url points at PgBouncer in
+        transaction pooling mode (PgBouncer 1.21+ with
+        max_prepared_statements set, so asyncpg's prepared statement
+        cache stays valid across server connections).
+        """
         try:
             self.engine = create_async_engine(
                 self.database_url,
-                pool_size=20,
-                max_overflow=10,
+                pool_size=10,
+                max_overflow=5,
                 pool_timeout=30,
-                pool_recycle=300,
+                pool_recycle=60,
+                pool_pre_ping=False,
+                json_serializer=_json_dumps,
+                json_deserializer=orjson.loads,
+                connect_args={
+                    'statement_cache_size': 1024,
+                    'prepared_statement_cache_size': 1024,
+                    'server_settings': {'jit': 'off'},
+                },
             )
             
-            self.async_session = sessionmaker(
-                self.engine, class_=AsyncSession, expire_on_commit=False
+            self.async_session = async_sessionmaker(
+                self.engine, expire_on_commit=False, autoflush=False
+            )
+            
+            # Reads run in autocommit mode, skipping BEGIN/COMMIT round-trips
+            self.read_engine = self.engine.execution_options(
+                isolation_level='AUTOCOMMIT'
             )
             
             async with self.engine.begin() as conn:
                 await conn.run_sync(Base.metadata.create_all)
                 
         except Exception as e:
-            logger.error(f"Failed to initialize database: {e}")
+            logger.error("Failed to initialize database: %s", e)
             raise StorageError(f"Database initialization failed: {e}")
             
+    async def _insert_rows(self, table: sa.Table, rows: List[Dict[str, Any]]) -> List[str]:
+        """
+        Insert rows, skipping IDs that already exist.
+        Returns IDs of the inserted rows.
+        """
+        if len(rows) > COPY_THRESHOLD:
+            return await self._copy_rows(table, rows)
+            
+        stmt = pg_insert(table).values(rows).on_conflict_do_nothing(
+            index_elements=['id']
+        ).returning(table.c.id)
+        
+        async with self.async_session() as session:
+            async with session.begin():
+                result = await session.execute(stmt)
+                return list(result.scalars().all())
+                
+    async def _copy_rows(self, table: sa.Table, rows: List[Dict[str, Any]]) -> List[str]:
+        """
+        Insert a large batch of rows using binary COPY.
+
+        COPY cannot skip conflicts, so rows are copied into a temporary
+        table first and moved over with INSERT ... ON CONFLICT DO NOTHING.
+        """
+        columns = list(rows[0]) + ['created_at']
+        created_at = datetime.utcnow()
+        records = [
+            tuple(
+                _json_dumps(row['data']) if column == 'data' else row[column]
+                for column in columns[:-1]
+            ) + (created_at,)
+            for row in rows
+        ]
+        staging = f"{table.name}_copy"
+        column_list = ', '.join(columns)
+        
+        async with self.engine.connect() as conn:
+            raw = await conn.get_raw_connection()
+            driver = raw.driver_connection
+            async with driver.transaction():
+                await driver.execute(
+                    f"CREATE TEMP TABLE {staging} "
+                    f"(LIKE {table.name} INCLUDING DEFAULTS) ON COMMIT DROP"
+                )
+                await driver.copy_records_to_table(
+                    staging, records=records, columns=columns
+                )
+                inserted = await driver.fetch(
+                    f"INSERT INTO {table.name} ({column_list}) "
+                    f"SELECT {column_list} FROM {staging} "
+                    f"ON CONFLICT (id) DO NOTHING RETURNING id"
+                )
+                
+        return [record['id'] for record in inserted]
+        
     async def bulk_create_activities(
         self,
         activities: List[Dict[str, Any]]
     ) -> List[str]:
-        """Bulk create activities."""
+        """
+        Bulk create activities in a single statement.
+        Activities that already exist are skipped; returns IDs of
+        the newly created ones.
+        """
         if not activities:
             return []
             
-        activity_models = []
-        activity_ids = []
-        
-        async with self.async_session() as session:
-            async with session.begin():
-                for activity_data in activities:
-                    activity_id = activity_data.get('id')
-                    if not activity_id:
-                        raise StorageError("Activity must have an ID")
-                        
-                    activity_ids.append(activity_id)
-                    activity = Activity(
-                        id=activity_id,
-                        type=ActivityType(activity_data.get('type')),
-                        actor=activity_data.get('actor'),
-                        object_id=activity_data.get('object', {}).get('id'),
-                        target_id=activity_data.get('target', {}).get('id'),
-                        data=activity_data,
-                        local=activity_data.get('local', False),
-                        visibility=activity_data.get('visibility', 'public')
-                    )
-                    activity_models.append(activity)
-                    
-                session.add_all(activity_models)
-                await session.commit()
+        rows = []
+        for activity_data in activities:
+            activity_id = activity_data.get('id')
+            if not activity_id:
+                raise StorageError("Activity must have an ID")
                 
-        return activity_ids
+            rows.append({
+                'id': activity_id,
+                'type': ActivityType(activity_data.get('type')).value,
+                'actor': activity_data.get('actor'),
+                'object_id': _id_of(activity_data, 'object'),
+                'target_id': _id_of(activity_data, 'target'),
+                'data': activity_data,
+                'local': activity_data.get('local', False),
+                'visibility': activity_data.get('visibility', 'public')
+            })
+            
+        return await self._insert_rows(Activity.__table__, rows)
         
     async def bulk_create_objects(
         self,
         objects: List[Dict[str, Any]]
     ) -> List[str]:
-        """Bulk create objects."""
+        """
+        Bulk create objects in a single statement.
+        Objects that already exist are skipped; returns IDs of
+        the newly created ones.
+        """
         if not objects:
             return []
             
-        object_models = []
-        object_ids = []
-        
-        async with self.async_session() as session:
-            async with session.begin():
-                for obj_data in objects:
-                    object_id = obj_data.get('id')
-                    if not object_id:
-                        raise StorageError("Object must have an ID")
-                        
-                    object_ids.append(object_id)
-                    obj = Object(
-                        id=object_id,
-                        type=ObjectType(obj_data.get('type')),
-                        attributed_to=obj_data.get('attributedTo'),
-                        data=obj_data,
-                        local=obj_data.get('local', False),
-                        visibility=obj_data.get('visibility', 'public'),
-                        content=obj_data.get('content')
-                    )
-                    object_models.append(obj)
-                    
-                session.add_all(object_models)
-                await session.commit()
+        rows = []
+        for obj_data in objects:
+            object_id = obj_data.get('id')
+            if not object_id:
+                raise StorageError("Object must have an ID")
                 
-        return object_ids
+            rows.append({
+                'id': object_id,
+                'type': ObjectType(obj_data.get('type')).value,
+                'attributed_to': obj_data.get('attributedTo'),
+                'data': obj_data,
+                'local': obj_data.get('local', False),
+                'visibility': obj_data.get('visibility', 'public'),
+                'content': obj_data.get('content')
+            })
+            
+        return await self._insert_rows(Object.__table__, rows)
         
     async def get_collection(
         self,
@@ -302,116 +526,104 @@ class SQLStorageBackend(BaseStorageBackend):
         collection_type = collection_parts[-1]
         actor_id = '/'.join(collection_parts[:-1])
         
-        async with self.async_session() as session:
-            if collection_type in ['followers', 'following']:
-                query = select(Follow).where(
-                    and_(
-                        Follow.following == actor_id if collection_type == 'followers' else Follow.follower == actor_id,
-                        Follow.accepted == True
-                    )
-                ).order_by(Follow.created_at.desc())
-                
-            elif collection_type in ['likes']:
-                query = select(Like).where(
-                    Like.object_id == actor_id
-                ).order_by(Like.created_at.desc())
-                
-            elif collection_type in ['outbox']:
-                query = select(Activity).where(
-                    and_(
-                        Activity.actor == actor_id,
-                        Activity.visibility == 'public'
-                    )
-                ).order_by(Activity.created_at.desc())
-                
-            elif collection_type in ['inbox']:
-                query = select(Activity).where(
-                    or_(
-                        and_(
-                            Activity.target_id == actor_id,
-                            Activity.visibility.in_(['public', 'followers'])
-                        ),
-                        Activity.actor == actor_id
-                    )
-                ).order_by(Activity.created_at.desc())
-                
-            else:
-                raise StorageError(f"Unsupported collection type: {collection_type}")
-                
-            if cursor:
-                query = query.where(Activity.created_at < cursor)
-                
-            query = query.limit(page_size + 1)
-            result = await session.execute(query)
-            items = result.scalars().all()
-            
-            next_cursor = None
-            if len(items) > page_size:
-                next_cursor = str(items[page_size].created_at)
-                items = items[:page_size]
-                
-            return [item.data for item in items], next_cursor
+        if collection_type in ['followers', 'following']:
+            model = Follow
+        elif collection_type in ['likes']:
+            model = Like
+        elif collection_type in ['outbox', 'inbox']:
+            model = Activity
+        else:
+            raise StorageError(f"Unsupported collection type: {collection_type}")
+            
+        criteria = []
+        if cursor:
+            cursor_dt, cursor_id = _parse_cursor(cursor, model)
+            criteria.append(
+                sa.tuple_(model.created_at, model.id) < sa.tuple_(cursor_dt, cursor_id)
+            )
+            
+        limit = page_size + 1
+        if collection_type in ['followers', 'following']:
+            member = Follow.follower if collection_type == 'followers' else Follow.following
+            query = select(*_page_columns(Follow, member)).where(
+                Follow.following == actor_id if collection_type == 'followers' else Follow.follower == actor_id,
+                Follow.accepted == True,
+                *criteria
+            ).order_by(*_newest_first(Follow)).limit(limit)
+            
+        elif collection_type in ['likes']:
+            query = select(*_page_columns(Like, Like.actor_id)).where(
+                Like.object_id == actor_id,
+                *criteria
+            ).order_by(*_newest_first(Like)).limit(limit)
+            
+        elif collection_type in ['outbox']:
+            query = _outbox_query(actor_id, limit, *criteria)
+            
+        else:
+            query = _inbox_query(actor_id, limit, *criteria)
+            
+        async with self.read_engine.connect() as conn:
+            result = await conn.execute(query)
+            items = result.all()
+            
+        next_cursor = None
+        if len(items) > page_size:
+            items = items[:page_size]
+            last = items[-1]
+            next_cursor = f"{last.created_at.isoformat()}|{last.id}"
+            
+        return [item.data for item in items], next_cursor
             
     async def search_objects(
         self,
         query: str,
         object_type: Optional[ObjectType] = None,
         limit: int = 20,
-        offset: int = 0
+        offset: int = 0,
+        match: Optional[Dict[str, Any]] = None
     ) -> List[Dict[str, Any]]:
-        """Search objects by content."""
-        async with self.async_session() as session:
-            stmt = select(Object).where(
-                Object.content.ilike(f"%{query}%")
-            )
+        """
+        Search objects by content.
+
+        Args:
+            query: Text to search for in object content
+            object_type: Optional object type filter
+            limit: Maximum number of results
+            offset: Number of results to skip
+            match: Optional JSON fragment the object data must contain,
+                e.g. {"attributedTo": "https://example.com/users/alice"}
+        """
+        async with self.read_engine.connect() as conn:
+            stmt = select(Object.data)
+            
+            if match:
+                # Containment lookups are served by idx_objects_data_gin
+                stmt = stmt.where(Object.data.contains(match))
+                
+            if query:
+                # Full-text match is served by idx_objects_content_tsv
+                ts_query = sa.func.plainto_tsquery('simple', query)
+                stmt = stmt.where(
+                    Object.content_tsv.op('@@')(ts_query)
+                ).order_by(
+                    sa.func.ts_rank_cd(Object.content_tsv, ts_query).desc()
+                )
             
             if object_type:
-                stmt = stmt.where(Object.type == object_type)
+                stmt = stmt.where(Object.type == ObjectType(object_type).value)
                 
             stmt = stmt.order_by(Object.created_at.desc()).offset(offset).limit(limit)
             
-            result = await session.execute(stmt)
-            objects = result.scalars().all()
-            return [obj.data for obj in objects]
+            result = await conn.execute(stmt)
+            return list(result.scalars().all())
             
     async def get_actor_stats(self, actor_id: str) -> Dict[str, int]:
         """Get actor statistics."""
-        async with self.async_session() as session:
-            # Count followers
-            followers = await session.execute(
-                select(sa.func.count()).where(
-                    and_(
-                        Follow.following == actor_id,
-                        Follow.accepted == True
-                    )
-                )
-            )
-            
-            # Count following
-            following = await session.execute(
-                select(sa.func.count()).where(
-                    and_(
-                        Follow.follower == actor_id,
-                        Follow.accepted == True
-                    )
-                )
-            )
-            
-            # Count posts
-            posts = await session.execute(
-                select(sa.func.count()).where(
-                    and_(
-                        Activity.actor == actor_id,
-                        Activity.type == ActivityType.CREATE
-                    )
-                )
-            )
-            
-            return {
-                "followers_count": followers.scalar(),
-                "following_count": following.scalar(),
-                "posts_count": posts.scalar()
-            }
+        # Fetch all counts in a single round-trip
+        async with self.read_engine.connect() as conn:
+            result = await conn.execute(_ACTOR_STATS_STMT, {'actor_id': actor_id})
+            return dict(result.mappings().one())
 
     async def create_activity(self, activity: Dict[str, Any]) -> str:
         """Store activity."""
@@ -423,10 +635,10 @@ class SQLStorageBackend(BaseStorageBackend):
             async with self.async_session() as session:
                 db_activity = Activity(
                     id=activity_id,
-                    type=ActivityType(activity.get('type')),
+                    type=ActivityType(activity.get('type')).value,
                     actor=activity.get('actor'),
-                    object_id=activity.get('object', {}).get('id'),
-                    target_id=activity.get('target', {}).get('id'),
+                    object_id=_id_of(activity, 'object'),
+                    target_id=_id_of(activity, 'target'),
                     data=activity,
                     local=activity.get('local', False),
                     visibility=activity.get('visibility', 'public')
@@ -437,7 +649,7 @@ class SQLStorageBackend(BaseStorageBackend):
             return activity_id
             
         except Exception as e:
-            logger.error(f"Failed to create activity: {e}")
+            logger.error("Failed to create activity: %s", e)
             raise StorageError(f"Failed to create activity: {e}")
             
     async def create_object(self, obj: Dict[str, Any]) -> str:
@@ -450,7 +662,7 @@ class SQLStorageBackend(BaseStorageBackend):
             async with self.async_session() as session:
                 db_object = Object(
                     id=object_id,
-                    type=ObjectType(obj.get('type')),
+                    type=ObjectType(obj.get('type')).value,
                     attributed_to=obj.get('attributedTo'),
                     data=obj,
                     local=obj.get('local', False),
@@ -463,7 +675,7 @@ class SQLStorageBackend(BaseStorageBackend):
             return object_id
             
         except Exception as e:
-            logger.error(f"Failed to create object: {e}")
+            logger.error("Failed to create object: %s", e)
             raise StorageError(f"Failed to create object: {e}")
             
     async def create_actor(self, actor: Dict[str, Any]) -> str:
@@ -476,7 +688,7 @@ class SQLStorageBackend(BaseStorageBackend):
             async with self.async_session() as session:
                 db_actor = Actor(
                     id=actor_id,
-                    type=ObjectType(actor.get('type')),
+                    type=ObjectType(actor.get('type')).value,
                     username=actor.get('preferredUsername'),
                     domain=actor.get('domain'),
                     inbox_url=actor.get('inbox'),
@@ -494,7 +706,7 @@ class SQLStorageBackend(BaseStorageBackend):
             return actor_id
             
         except Exception as e:
-            logger.error(f"Failed to create actor: {e}")
+            logger.error("Failed to create actor: %s", e)
             raise StorageError(f"Failed to create actor: {e}")
             
     async def create_follow(self, follower: str, following: str) -> None:
@@ -506,88 +718,106 @@ class SQLStorageBackend(BaseStorageBackend):
                 await session.commit()
                 
         except Exception as e:
-            logger.error(f"Failed to create follow: {e}")
+            logger.error("Failed to create follow: %s", e)
             raise StorageError(f"Failed to create follow: {e}")
             
-    async def get_inbox(self, actor_id: str, limit: int = 20, offset: int = 0) -> List[Dict[str, Any]]:
-        """Get actor's inbox."""
+    async def _get_activity_page(
+        self,
+        build_query,
+        actor_id: str,
+        limit: int,
+        cursor: Optional[str]
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Get a page of activities older than `cursor`.
+        Returns (items, next_cursor).
+        """
+        criteria = []
+        if cursor:
+            # Row-value comparison so rows sharing the boundary timestamp
+            # are not skipped; matches idx_activities_created_id
+            cursor_dt, cursor_id = _parse_cursor(cursor, Activity)
+            criteria.append(
+                sa.tuple_(Activity.created_at, Activity.id) < sa.tuple_(cursor_dt, cursor_id)
+            )
+        query = build_query(actor_id, limit + 1, *criteria)
+            
+        async with self.read_engine.connect() as conn:
+            result = await conn.execute(query)
+            activities = result.all()
+            
+        next_cursor = None
+        if len(activities) > limit:
+            activities = activities[:limit]
+            last = activities[-1]
+            next_cursor = f"{last.created_at.isoformat()}|{last.id}"
+            
+        return [activity.data for activity in activities], next_cursor
+            
+    async def get_inbox(
+        self,
+        actor_id: str,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Get actor's inbox.
+        Returns (items, next_cursor) where next_cursor is passed as
+        `cursor` to fetch the following page.
+        """
         try:
-            async with self.async_session() as session:
-                query = select(Activity).where(
-                    or_(
-                        and_(
-                            Activity.target_id == actor_id,
-                            Activity.visibility.in_(['public', 'followers'])
-                        ),
-                        Activity.actor == actor_id
-                    )
-                ).order_by(
-                    Activity.created_at.desc()
-                ).offset(offset).limit(limit)
-                
-                result = await session.execute(query)
-                activities = result.scalars().all()
-                
-                return [activity.data for activity in activities]
+            return await self._get_activity_page(
+                _inbox_query, actor_id, limit, cursor
+            )
                 
         except Exception as e:
-            logger.error(f"Failed to get inbox: {e}")
+            logger.error("Failed to get inbox: %s", e)
             raise StorageError(f"Failed to get inbox: {e}")
             
-    async def get_outbox(self, actor_id: str, limit: int = 20, offset: int = 0) -> List[Dict[str, Any]]:
-        """Get actor's outbox."""
+    async def get_outbox(
+        self,
+        actor_id: str,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Get actor's outbox.
+        Returns (items, next_cursor) where next_cursor is passed as
+        `cursor` to fetch the following page.
+        """
         try:
-            async with self.async_session() as session:
-                query = select(Activity).where(
-                    and_(
-                        Activity.actor == actor_id,
-                        Activity.visibility == 'public'
-                    )
-                ).order_by(
-                    Activity.created_at.desc()
-                ).offset(offset).limit(limit)
-                
-                result = await session.execute(query)
-                activities = result.scalars().all()
-                
-                return [activity.data for activity in activities]
+            return await self._get_activity_page(
+                _outbox_query, actor_id, limit, cursor
+            )
                 
         except Exception as e:
-            logger.error(f"Failed to get outbox: {e}")
+            logger.error("Failed to get outbox: %s", e)
             raise StorageError(f"Failed to get outbox: {e}")
             
     async def get_followers(self, actor_id: str) -> List[str]:
         """Get actor's followers."""
         try:
-            async with self.async_session() as session:
-                query = select(Follow.follower).where(
-                    and_(
-                        Follow.following == actor_id,
-                        Follow.accepted == True
-                    )
+            async with self.read_engine.connect() as conn:
+                result = await conn.execute(
+                    _FOLLOWERS_STMT, {'actor_id': actor_id}
                 )
-                result = await session.execute(query)
                 return result.scalars().all()
                 
         except Exception as e:
-            logger.error(f"Failed to get followers: {e}")
+            logger.error("Failed to get followers: %s", e)
             raise StorageError(f"Failed to get followers: {e}")
             
     async def get_following(self, actor_id: str) -> List[str]:
         """Get actors that this actor is following."""
         try:
-            async with self.async_session() as session:
-                query = select(Follow.following).where(
-                    and_(
-                        Follow.follower == actor_id,
-                        Follow.accepted == True
-                    )
+            async with self.read_engine.connect() as conn:
+                result = await conn.execute(
+                    _FOLLOWING_STMT, {'actor_id': actor_id}
                 )
-                result = await session.execute(query)
                 return result.scalars().all()
                 
         except Exception as e:
-            logger.error(f"Failed to get following: {e}")
+            logger.error("Failed to get following: %s", e)
             raise StorageError(f"Failed to get following: {e}")
             
     async def close(self) -> None:
@@ -21,7 +21,7 @@ class SignatureVerificationError(ActivityPubException):
     pass
 
 class SignatureError(ActivityPubException):
-    """Raised when signature creation fails."""
+    """Raised when signature-related errors occur."""
     pass
 
 class AuthenticationError(ActivityPubException):
@@ -33,7 +33,7 @@ class RateLimitExceeded(ActivityPubException):
     pass
 
 class WebFingerError(ActivityPubException):
-    """Raised when WebFinger lookup fails."""
+    """Raised when WebFinger-related errors occur."""
     pass
 
 class SecurityError(ActivityPubException):
@@ -41,7 +41,7 @@ class SecurityError(ActivityPubException):
     pass
 
 class DeliveryError(ActivityPubException):
-    """Raised when delivery fails."""
+    """Raised when delivery-related errors occur."""
     pass
 
 class FetchError(ActivityPubException):
@@ -76,44 +76,20 @@ class RateLimiterError(ActivityPubException):
     """Raised when rate limiter-related errors occur."""
     pass
 
-class FetchError(ActivityPubException):
-    """Raised when fetching fails."""
-    pass
-
 class StorageError(ActivityPubException):
     """Raised when storage-related errors occur."""
-    pass    
-
-class DiscoveryError(ActivityPubException):
-    """Raised when discovery fails."""
-    pass    
+    pass
 
 class ResolverError(ActivityPubException):
     """Raised when resolver-related errors occur."""
-    pass    
-
-class SignatureError(ActivityPubException):
-    """Raised when signature-related errors occur."""
     pass
 
 class SecurityValidatorError(ActivityPubException):
     """Raised when security validator-related errors occur."""
     pass
 
-class DeliveryError(ActivityPubException):
-    """Raised when delivery-related errors occur."""
-    pass
-
 class ResourceFetcherError(ActivityPubException):
     """Raised when resource fetcher-related errors occur."""
-    pass    
-
-class SecurityValidatorError(ActivityPubException):
-    """Raised when security validator-related errors occur."""
-    pass   
-
-class WebFingerError(ActivityPubException):
-    """Raised when WebFinger-related errors occur."""
     pass
 
 class KeyManagementError(ActivityPubException):
@@ -142,4 +118,4 @@ class IntegrationError(ActivityPubException):
 
 class MiddlewareError(ActivityPubException):
     """Raised when middleware-related errors occur."""
-    pass
\ No newline at end of file
+    pass
@@ -1,27 +1,76 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from typing import Optional
 
+# Background listener that performs handler I/O off the emitting thread
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+
 def configure_logging(level: Optional[str] = None):
     """
     Configure the logging system for the ActivityPub library.
 
+    Records are put on a queue by the root logger and written to stdout
+    and the log file by a background listener thread, so logging calls
+    never block on file I/O.
+
+    Like logging.basicConfig, this does nothing if the root logger already
+    has handlers that were not installed here, so an application's own
+    logging setup is left alone.
+
     Args:
         level (Optional[str]): The logging level. If None, defaults to INFO.
     """
+    global _listener, _queue_handler
+
     if level is None:
         level = logging.INFO
     else:
         level = getattr(logging, level.upper())
 
-    logging.basicConfig(
-        level=level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler('activitypub_library.log')
-        ]
+    root = logging.getLogger()
+    if any(handler is not _queue_handler for handler in root.handlers):
+        return
+
+    if _listener is not None:
+        _listener.stop()
+        root.removeHandler(_queue_handler)
+        # Release the previous stream and log file before opening new ones
+        for handler in _listener.handlers:
+            handler.close()
+
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    stream_handler = logging.StreamHandler(sys.stdout)
+    file_handler = logging.handlers.RotatingFileHandler(
+        'activitypub_library.log',
+        maxBytes=64 << 20,
+        backupCount=3
     )
+    for handler in (stream_handler, file_handler):
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    _queue_handler = logging.handlers.QueueHandler(log_queue)
+    _listener = logging.handlers.QueueListener(
+        log_queue,
+        stream_handler,
+        file_handler,
+        respect_handler_level=True
+    )
+
+    root.setLevel(level)
+    root.addHandler(_queue_handler)
+    _listener.start()
+
+def _stop_listener() -> None:
+    """Flush queued records on interpreter exit."""
+    if _listener is not None:
+        _listener.stop()
+
+atexit.register(_stop_listener)
 
 def get_logger(name: str) -> logging.Logger:
     """
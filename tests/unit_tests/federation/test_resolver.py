@@ -1,5 +1,7 @@
+import asyncio
 import pytest
-from unittest.mock import AsyncMock, patch
+from aioresponses import aioresponses, CallbackResult
+from yarl import URL
 from pyfed.federation.resolver import ActivityPubResolver
 
 @pytest.mark.asyncio
@@ -8,16 +10,14 @@ async def test_resolve_actor_success():
     actor_id = "https://example.com/actor"
     
     # Mock the HTTP response
-    with patch('aiohttp.ClientSession.get', new_callable=AsyncMock) as mock_get:
-        mock_get.return_value.__aenter__.return_value.status = 200
-        mock_get.return_value.__aenter__.return_value.json.return_value = {
+    with aioresponses() as m:
+        m.get(actor_id, payload={
             "id": actor_id,
             "type": "Person",
             "name": "Test Actor"
-        }
+        })
         
         actor_data = await resolver.resolve_actor(actor_id)
-        print(actor_data)
         assert actor_data['id'] == actor_id
         assert actor_data['type'] == "Person"
 
@@ -26,8 +26,78 @@ async def test_resolve_actor_not_found():
     resolver = ActivityPubResolver()
     actor_id = "https://example.com/unknown_actor"
     
-    with patch('aiohttp.ClientSession.get', new_callable=AsyncMock) as mock_get:
-        mock_get.return_value.__aenter__.return_value.status = 404
+    with aioresponses() as m:
+        m.get(actor_id, status=404)
         
         actor_data = await resolver.resolve_actor(actor_id)
-        assert actor_data is None
\ No newline at end of file
+        assert actor_data is None
+
+@pytest.mark.asyncio
+async def test_resolver_coalesces_inflight():
+    resolver = ActivityPubResolver()
+    actor_id = "https://example.com/actor"
+    
+    with aioresponses() as m:
+        m.get(actor_id, payload={"id": actor_id, "type": "Person"}, repeat=True)
+        
+        results = await asyncio.gather(
+            *(resolver.resolve_actor(actor_id) for _ in range(10))
+        )
+        assert all(actor_data['id'] == actor_id for actor_data in results)
+        assert len(m.requests[('GET', URL(actor_id))]) == 1
+
+@pytest.mark.asyncio
+async def test_resolver_first_caller_cancelled():
+    resolver = ActivityPubResolver()
+    actor_id = "https://example.com/actor"
+    
+    async def slow_response(url, **kwargs):
+        await asyncio.sleep(0.05)
+        return CallbackResult(payload={"id": actor_id, "type": "Person"})
+    
+    with aioresponses() as m:
+        m.get(actor_id, callback=slow_response)
+        
+        first = asyncio.create_task(resolver.resolve_actor(actor_id))
+        await asyncio.sleep(0)
+        others = [
+            asyncio.create_task(resolver.resolve_actor(actor_id))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        first.cancel()
+        
+        results = await asyncio.gather(*others)
+        assert all(actor_data['id'] == actor_id for actor_data in results)
+        assert first.cancelled()
+        assert len(m.requests[('GET', URL(actor_id))]) == 1
+
+@pytest.mark.asyncio
+async def test_resolve_actor_cached():
+    resolver = ActivityPubResolver()
+    actor_id = "https://example.com/actor"
+    
+    with aioresponses() as m:
+        m.get(actor_id, payload={"id": actor_id, "type": "Person"}, repeat=True)
+        
+        first = await resolver.resolve_actor(actor_id)
+        second = await resolver.resolve_actor(actor_id)
+        assert first == second
+        assert len(m.requests[('GET', URL(actor_id))]) == 1
+
+@pytest.mark.asyncio
+async def test_resolve_actor_no_store():
+    resolver = ActivityPubResolver()
+    actor_id = "https://example.com/actor"
+    
+    with aioresponses() as m:
+        m.get(
+            actor_id,
+            payload={"id": actor_id, "type": "Person"},
+            headers={"Cache-Control": "no-store"},
+            repeat=True
+        )
+        
+        await resolver.resolve_actor(actor_id)
+        await resolver.resolve_actor(actor_id)
+        assert len(m.requests[('GET', URL(actor_id))]) == 2
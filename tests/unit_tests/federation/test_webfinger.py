@@ -1,15 +1,21 @@
+import pytest
+from aioresponses import aioresponses
+from pyfed.federation.webfinger import WebFingerClient
+
 @pytest.mark.asyncio
 async def test_webfinger_client_success():
     client = WebFingerClient()
+    await client.initialize()
     account = "user@example.com"
     
-    with patch('aiohttp.ClientSession.get', new_callable=AsyncMock) as mock_get:
-        mock_get.return_value.__aenter__.return_value.status = 200
-        mock_get.return_value.__aenter__.return_value.json.return_value = {
+    with aioresponses() as m:
+        m.get("https://example.com/.well-known/webfinger?resource=acct%3Auser%40example.com", payload={
             "subject": f"acct:{account}",
             "aliases": ["https://example.com/user"],
-            "links": [{"rel": "self", "href": "https://example.com/user"}]
-        }
+            "links": [{"rel": "self", "type": "application/activity+json", "href": "https://example.com/user"}]
+        })
         
         result = await client.get_actor_url(account)
-        assert result == "https://example.com/user"
\ No newline at end of file
+        assert result == "https://example.com/user"
+    
+    await client.close()
@@ -0,0 +1,42 @@
+"""
+Shared fixtures for model tests.
+"""
+from typing import Dict, Tuple
+
+import pytest
+from pydantic import TypeAdapter
+from pyfed.models import APPerson
+
+@pytest.fixture(scope="session")
+def make_person():
+    """
+    Build APPerson instances from defaults through one shared TypeAdapter.
+
+    Models are frozen, so each distinct set of hashable arguments is
+    validated once and the same instance is handed out for the rest of the
+    session; callers must not mutate what they get back. Overrides with
+    unhashable values such as lists or dicts build a fresh instance.
+    """
+    adapter = TypeAdapter(APPerson)
+    people: Dict[Tuple, APPerson] = {}
+
+    def build(n: int, overrides: Dict) -> APPerson:
+        base = f"https://example.com/person/{n}"
+        return adapter.validate_python({
+            "id": base,
+            "inbox": f"{base}/inbox",
+            "outbox": f"{base}/outbox",
+            **overrides
+        })
+
+    def make(n: int = 1, **overrides) -> APPerson:
+        key = (n, *sorted(overrides.items()))
+        try:
+            person = people.get(key)
+        except TypeError:
+            return build(n, overrides)
+        if person is None:
+            person = people[key] = build(n, overrides)
+        return person
+
+    return make
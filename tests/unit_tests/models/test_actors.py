@@ -56,6 +56,16 @@ def test_invalid_person_invalid_url():
             outbox="https://example.com/users/alice/outbox"
         )
 
+def test_frozen_model_raises():
+    person = APPerson(
+        id="https://example.com/users/alice",
+        name="Alice",
+        inbox="https://example.com/users/alice/inbox",
+        outbox="https://example.com/users/alice/outbox"
+    )
+    with pytest.raises(ValidationError):
+        person.name = "Bob"
+
 def test_valid_group():
     group = APGroup(
         id="https://example.com/groups/admins",
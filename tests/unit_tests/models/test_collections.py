@@ -6,7 +6,8 @@ import pytest
 from pydantic import ValidationError
 from pyfed.models import (
     APCollection, APOrderedCollection,
-    APCollectionPage, APOrderedCollectionPage
+    APCollectionPage, APOrderedCollectionPage,
+    AP_OBJECT_LIST_ADAPTER
 )
 
 def test_valid_collection():
@@ -115,3 +116,14 @@ def test_ordered_collection_empty():
     )
     assert collection.total_items == 0
     assert collection.ordered_items is None
+
+def test_bulk_items_adapter():
+    """Test validating a list of raw items in one pass."""
+    raw_items = [
+        {"id": f"https://example.com/object/{i}", "type": "Object", "name": f"Object {i}"}
+        for i in range(1000)
+    ]
+    items = AP_OBJECT_LIST_ADAPTER.validate_python(raw_items)
+    assert len(items) == 1000
+    assert [str(item.id) for item in items] == [raw["id"] for raw in raw_items]
+    assert items[999].name == "Object 999"
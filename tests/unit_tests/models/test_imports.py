@@ -12,7 +12,8 @@ from pyfed.models import (
     APActor, APPerson, APGroup, APOrganization, APApplication, APService,
     APLink, APMention,
     APCollection, APOrderedCollection, APCollectionPage, APOrderedCollectionPage,
-    APCreate, APUpdate, APDelete, APFollow, APUndo, APLike, APAnnounce
+    APCreate, APUpdate, APDelete, APFollow, APUndo, APLike, APAnnounce,
+    AP_TYPE_MAP
 )
 
 def test_can_import_models():
@@ -62,6 +63,24 @@ def test_can_import_activities():
     assert APLike
     assert APAnnounce
 
+def test_type_map_complete():
+    """Test that every concrete type is in the type map."""
+    for cls in (
+        APEvent, APPlace, APProfile, APRelationship, APTombstone,
+        APArticle, APAudio, APDocument, APImage, APNote, APPage, APVideo,
+        APPerson, APGroup, APOrganization, APApplication, APService,
+        APLink, APMention,
+        APCollection, APOrderedCollection, APCollectionPage, APOrderedCollectionPage,
+        APCreate, APUpdate, APDelete, APFollow, APUndo, APLike, APAnnounce
+    ):
+        assert AP_TYPE_MAP[cls.model_fields['type'].default] is cls
+
 def test_can_import_serializer():
     """Test that the serializer can be imported."""
     assert ActivityPubSerializer
+
+def test_unknown_model_name_raises():
+    """Test that lazy lookup rejects names the package does not export."""
+    import pyfed.models
+    with pytest.raises(AttributeError):
+        pyfed.models.APMissing
@@ -5,14 +5,36 @@ This module contains tests for the interactions between ActivityPub models.
 import pytest
 from datetime import datetime, timedelta
 from pyfed.models import (
-    APEvent, APPlace, APPerson, APNote, APObject, APImage,
+    APEvent, APPlace, APNote, APObject, APImage,
     APCollection, APOrderedCollection, APLink, APMention,
     APCreate, APLike, APFollow, APAnnounce, APUpdate, APDelete,
     APUndo, APDocument, APGroup, APOrganization, APOrderedCollectionPage,
     APRelationship
 )
 
-def test_event_with_place_and_attendees():
+PUBLIC = ("https://www.w3.org/ns/activitystreams#Public",)
+NOTE_IDS = tuple(f"https://example.com/note/{i}" for i in range(12))
+NOTE_CONTENTS = tuple(f"Note {i}" for i in range(12))
+
+@pytest.fixture(scope="module")
+def original_note():
+    """A note the interaction tests reply to, like and update."""
+    return APNote(
+        id="https://example.com/note/1",
+        content="Original content"
+    )
+
+@pytest.fixture(scope="module")
+def venue():
+    """A place shared by the event tests."""
+    return APPlace(
+        id="https://example.com/place/1",
+        name="Conference Center",
+        latitude=51.5074,
+        longitude=-0.1278
+    )
+
+def test_event_with_place_and_attendees(make_person):
     """Test creating an event with a location and attendees."""
     place = APPlace(
         id="https://example.com/place/123",
@@ -20,36 +42,21 @@ def test_event_with_place_and_attendees():
         latitude=52.5200,
         longitude=13.4050
     )
-    attendee1 = APPerson(
-        id="https://example.com/person/1",
-        name="John Doe",
-        inbox="https://example.com/person/1/inbox",
-        outbox="https://example.com/person/1/outbox"
-    )
-    attendee2 = APPerson(
-        id="https://example.com/person/2",
-        name="Jane Doe",
-        inbox="https://example.com/person/2/inbox",
-        outbox="https://example.com/person/2/outbox"
-    )
+    attendee1 = make_person(1, name="John Doe")
+    attendee2 = make_person(2, name="Jane Doe")
     event = APEvent(
         id="https://example.com/event/123",
         name="Test Event",
         location=place,
-        to=[str(attendee1.id), str(attendee2.id)]
+        to=[attendee1.id_str, attendee2.id_str]
     )
-    assert str(event.location.id) == "https://example.com/place/123"
+    assert event.location.id_str == "https://example.com/place/123"
     assert event.location.name == "Event Venue"
     assert len(event.to) == 2
 
-def test_note_with_mentions_and_attachments():
+def test_note_with_mentions_and_attachments(make_person):
     """Test creating a note with mentions and attachments."""
-    mentioned_person = APPerson(
-        id="https://example.com/person/1",
-        name="John Doe",
-        inbox="https://example.com/person/1/inbox",
-        outbox="https://example.com/person/1/outbox"
-    )
+    mentioned_person = make_person(1, name="John Doe")
     image = APImage(
         id="https://example.com/image/1",
         type="Image",
@@ -60,7 +67,7 @@ def test_note_with_mentions_and_attachments():
     note = APNote(
         id="https://example.com/note/123",
         content="Hello @John! Check out this image.",
-        tag=[{"type": "Mention", "href": str(mentioned_person.id)}],
+        tag=[{"type": "Mention", "href": mentioned_person.id_str}],
         attachment=[image]
     )
     assert len(note.tag) == 1
@@ -70,9 +77,9 @@ def test_note_with_mentions_and_attachments():
 def test_collection_with_pagination():
     """Test creating a collection with pagination."""
     items = [
-        APNote(
-            id=f"https://example.com/note/{i}",
-            content=f"Note {i}"
+        APNote.model_construct(
+            id=NOTE_IDS[i],
+            content=NOTE_CONTENTS[i]
         ) for i in range(1, 6)
     ]
     collection = APCollection(
@@ -84,16 +91,11 @@ def test_collection_with_pagination():
     )
     assert collection.total_items == 5
     assert len(collection.items) == 5
-    assert str(collection.first).endswith("page=1")
+    assert collection.first.endswith("page=1")
 
-def test_create_activity_with_note():
+def test_create_activity_with_note(make_person):
     """Test creating a Create activity with a note."""
-    author = APPerson(
-        id="https://example.com/person/1",
-        name="John Doe",
-        inbox="https://example.com/person/1/inbox",
-        outbox="https://example.com/person/1/outbox"
-    )
+    author = make_person(1, name="John Doe")
     note = APNote(
         id="https://example.com/note/123",
         content="Hello, World!"
@@ -102,28 +104,16 @@ def test_create_activity_with_note():
         id="https://example.com/activity/123",
         actor=author,
         object=note,
-        to=["https://www.w3.org/ns/activitystreams#Public"]
+        to=PUBLIC
     )
     assert activity.type == "Create"
     assert activity.is_public()
     assert isinstance(activity.object, APNote)
 
-def test_like_and_announce_interaction():
+def test_like_and_announce_interaction(make_person, original_note):
     """Test liking and announcing an object."""
-    original_note = APNote(
-        id="https://example.com/note/123",
-        content="Original content"
-    )
-    liker = APPerson(
-        id="https://example.com/person/1",
-        inbox="https://example.com/person/1/inbox",
-        outbox="https://example.com/person/1/outbox"
-    )
-    announcer = APPerson(
-        id="https://example.com/person/2",
-        inbox="https://example.com/person/2/inbox",
-        outbox="https://example.com/person/2/outbox"
-    )
+    liker = make_person(1)
+    announcer = make_person(2)
     
     like = APLike(
         id="https://example.com/activity/like/123",
@@ -138,24 +128,20 @@ def test_like_and_announce_interaction():
     
     assert like.type == "Like"
     assert announce.type == "Announce"
-    assert str(like.object.id) == str(original_note.id)
-    assert str(announce.object.id) == str(original_note.id)
+    assert like.object.id == original_note.id
+    assert announce.object.id == original_note.id
 
-def test_follow_with_collections():
+def test_follow_with_collections(make_person):
     """Test following relationship with collections."""
-    follower = APPerson(
-        id="https://example.com/person/1",
+    follower = make_person(
+        1,
         name="Follower",
-        inbox="https://example.com/person/1/inbox",
-        outbox="https://example.com/person/1/outbox",
         following="https://example.com/person/1/following",
         followers="https://example.com/person/1/followers"
     )
-    followed = APPerson(
-        id="https://example.com/person/2",
+    followed = make_person(
+        2,
         name="Followed",
-        inbox="https://example.com/person/2/inbox",
-        outbox="https://example.com/person/2/outbox",
         following="https://example.com/person/2/following",
         followers="https://example.com/person/2/followers"
     )
@@ -167,20 +153,14 @@ def test_follow_with_collections():
     )
     
     assert follow.type == "Follow"
-    assert str(follow.actor.id) == str(follower.id)
-    assert str(follow.object.id) == str(followed.id)
+    assert follow.actor.id == follower.id
+    assert follow.object.id == followed.id
     assert follower.following is not None
     assert followed.followers is not None
 
-def test_mention_in_content():
+def test_mention_in_content(make_person):
     """Test mentioning users in content with links."""
-    mentioned = APPerson(
-        id="https://example.com/person/1",
-        name="John Doe",
-        preferred_username="john",
-        inbox="https://example.com/person/1/inbox",
-        outbox="https://example.com/person/1/outbox"
-    )
+    mentioned = make_person(1, name="John Doe", preferred_username="john")
     
     mention = APMention(
         id="https://example.com/mention/123",
@@ -194,16 +174,16 @@ def test_mention_in_content():
         tag=[mention]
     )
     
-    assert mention in note.tag
+    assert any(t is mention for t in note.tag)
     assert mention.name in note.content
-    assert str(mention.href) == str(mentioned.id)
+    assert mention.href == mentioned.id
 
 def test_collection_pagination_interaction():
     """Test interaction between collections and their pages."""
     items = [
-        APNote(
-            id=f"https://example.com/note/{i}",
-            content=f"Note {i}"
+        APNote.model_construct(
+            id=NOTE_IDS[i],
+            content=NOTE_CONTENTS[i]
         ) for i in range(1, 11)
     ]
     
@@ -225,7 +205,7 @@ def test_collection_pagination_interaction():
     assert len(page.ordered_items) == 5
     assert page.start_index == 5
 
-def test_actor_relationships():
+def test_actor_relationships(make_person):
     """Test complex relationships between actors."""
     organization = APOrganization(
         id="https://example.com/org/1",
@@ -241,12 +221,7 @@ def test_actor_relationships():
         outbox="https://example.com/group/1/outbox"
     )
     
-    member = APPerson(
-        id="https://example.com/person/1",
-        name="John Developer",
-        inbox="https://example.com/person/1/inbox",
-        outbox="https://example.com/person/1/outbox"
-    )
+    member = make_person(1, name="John Developer")
     
     relationship = APRelationship(
         id="https://example.com/relationship/1",
@@ -256,8 +231,8 @@ def test_actor_relationships():
     )
     
     assert relationship.relationship == "member"
-    assert str(relationship.subject) == str(member.id)
-    assert str(relationship.object) == str(group.id)
+    assert relationship.subject == member.id
+    assert relationship.object == group.id
 
 def test_content_with_multiple_attachments():
     """Test creating content with multiple types of attachments."""
@@ -284,22 +259,16 @@ def test_content_with_multiple_attachments():
     assert isinstance(note.attachment[0], APImage)
     assert isinstance(note.attachment[1], APDocument)
 
-def test_event_series():
+def test_event_series(venue):
     """Test creating a series of related events."""
-    venue = APPlace(
-        id="https://example.com/place/1",
-        name="Conference Center",
-        latitude=51.5074,
-        longitude=-0.1278
-    )
-    
+    now = datetime.now()
     events = [
-        APEvent(
+        APEvent.model_construct(
             id=f"https://example.com/event/{i}",
             name=f"Workshop Day {i}",
             location=venue,
-            start_time=(datetime.now() + timedelta(days=i)).isoformat(),
-            end_time=(datetime.now() + timedelta(days=i, hours=2)).isoformat()
+            start_time=(now + timedelta(days=i)).isoformat(),
+            end_time=(now + timedelta(days=i, hours=2)).isoformat()
         ) for i in range(1, 4)
     ]
     
@@ -309,46 +278,32 @@ def test_event_series():
         ordered_items=events
     )
     
+    venue_id = venue.id
     assert len(collection.ordered_items) == 3
-    assert all(isinstance(event, APEvent) for event in collection.ordered_items)
-    assert all(event.location.id == venue.id for event in collection.ordered_items)
+    assert {type(event) for event in collection.ordered_items} == {APEvent}
+    assert all(event.location.id == venue_id for event in collection.ordered_items)
 
-def test_nested_replies():
+def test_nested_replies(original_note):
     """Test handling nested replies to content."""
-    original_note = APNote(
-        id="https://example.com/note/1",
-        content="Original post"
-    )
-    
     reply1 = APNote(
         id="https://example.com/note/2",
         content="First reply",
-        in_reply_to=str(original_note.id)
+        in_reply_to=original_note.id
     )
     
     reply2 = APNote(
         id="https://example.com/note/3",
         content="Reply to reply",
-        in_reply_to=str(reply1.id)
+        in_reply_to=reply1.id
     )
     
-    assert str(reply1.in_reply_to) == str(original_note.id)
-    assert str(reply2.in_reply_to) == str(reply1.id)
+    assert reply1.in_reply_to == original_note.id
+    assert reply2.in_reply_to == reply1.id
 
-def test_activity_chain():
+def test_activity_chain(make_person, original_note):
     """Test a chain of related activities."""
-    author = APPerson(
-        id="https://example.com/person/1",
-        name="Author",
-        inbox="https://example.com/person/1/inbox",
-        outbox="https://example.com/person/1/outbox"
-    )
-    
-    # Create a note
-    note = APNote(
-        id="https://example.com/note/1",
-        content="Original content"
-    )
+    author = make_person(1, name="Author")
+    note = original_note
     
     create = APCreate(
         id="https://example.com/activity/1",
@@ -357,11 +312,11 @@ def test_activity_chain():
     )
     
     # Update the note
-    note.content = "Updated content"
+    updated_note = note.model_copy(update={"content": "Updated content"})
     update = APUpdate(
         id="https://example.com/activity/2",
         actor=author,
-        object=note
+        object=updated_note
     )
     
     # Delete the note
@@ -382,4 +337,4 @@ def test_activity_chain():
     assert update.type == "Update"
     assert delete.type == "Delete"
     assert undo.type == "Undo"
-    assert str(undo.object.id) == str(delete.id)
+    assert undo.object.id == delete.id
@@ -5,6 +5,8 @@ Tests for ActivityPub serialization.
 import pytest
 from datetime import datetime, timezone
 import json
+from unittest.mock import patch
+from pydantic import TypeAdapter, ValidationError
 
 from pyfed.models import (
     APObject, APNote, APPerson, APCollection,
@@ -12,6 +14,10 @@ from pyfed.models import (
 )
 from pyfed.serializers.json_serializer import ActivityPubSerializer
 
+NOTE_LIST_ADAPTER = TypeAdapter(list[APNote])
+PUBLIC = ("https://www.w3.org/ns/activitystreams#Public",)
+CONTEXT = ('https://www.w3.org/ns/activitystreams', 'https://w3id.org/security/v1')
+
 def test_serialize_ap_object():
     """Test basic object serialization."""
     obj = APObject(
@@ -23,7 +29,7 @@ def test_serialize_ap_object():
     serialized = obj.serialize()
     
     # Verify serialization
-    assert serialized["@context"] == ['https://www.w3.org/ns/activitystreams', 'https://w3id.org/security/v1']
+    assert serialized["@context"] == list(CONTEXT)
     assert serialized["id"] == "https://example.com/object/123"
     assert serialized["type"] == "Object"
     assert serialized["name"] == "Test Object"
@@ -66,12 +72,10 @@ def test_serialize_nested_objects():
 
 def test_serialize_collection():
     """Test serialization of collections."""
-    items = [
-        APNote(
-            id=f"https://example.com/notes/{i}",
-            content=f"Note {i}"
-        ).serialize() for i in range(3)
-    ]
+    items = NOTE_LIST_ADAPTER.validate_python([
+        {"id": f"https://example.com/notes/{i}", "content": f"Note {i}"}
+        for i in range(3)
+    ])
     collection = APCollection(
         id="https://example.com/collection/1",
         total_items=len(items),
@@ -116,7 +120,7 @@ def test_deserialize_ap_object():
     obj = ActivityPubSerializer.deserialize(data, APObject)
     
     # Verify deserialization
-    assert str(obj.id) == "https://example.com/object/123"
+    assert obj.id.unicode_string() == "https://example.com/object/123"
     assert obj.type == "Object"
     assert obj.name == "Test Object"
     assert obj.content == "This is a test object."
@@ -131,13 +135,13 @@ def test_deserialize_from_json_string():
     obj = ActivityPubSerializer.deserialize(json_str, APObject)
     
     # Verify deserialization from string
-    assert str(obj.id) == "https://example.com/object/123"
+    assert obj.id.unicode_string() == "https://example.com/object/123"
     assert obj.type == "Object"
     assert obj.name == "Test Object"
 
 def test_deserialize_invalid_json():
     """Test deserialization of invalid JSON."""
-    with pytest.raises(ValueError):
+    with pytest.raises(ValidationError):
         ActivityPubSerializer.deserialize("invalid json", APObject)
 
 def test_deserialize_missing_required_fields():
@@ -152,18 +156,81 @@ def test_serialize_deserialize_complex_object():
         id="https://example.com/notes/123",
         content="Test content",
         to=["https://example.com/users/bob"],
-        cc=["https://www.w3.org/ns/activitystreams#Public"]
+        cc=PUBLIC
     )
-    serialized = original.serialize()
+    serialized = original.to_json_bytes()
     deserialized = ActivityPubSerializer.deserialize(serialized, APNote)
     
     # Verify round-trip
-    assert str(deserialized.id) == str(original.id)
+    assert deserialized.id_str == original.id_str
     assert deserialized.type == original.type
     assert deserialized.content == original.content
     assert deserialized.to == original.to
     assert deserialized.cc == original.cc
 
+def test_deserialize_trusted_skips_validation():
+    """Test the trusted path builds the model without re-validating stored data."""
+    original = APNote(
+        id="https://example.com/notes/123",
+        content="Test content",
+        to=["https://example.com/users/bob"],
+        cc=PUBLIC
+    )
+    deserialized = ActivityPubSerializer.deserialize(
+        original.to_json_bytes(), APNote, trusted=True
+    )
+
+    assert isinstance(deserialized, APNote)
+    assert deserialized.id_str == original.id_str
+    assert deserialized.content == original.content
+    assert deserialized.to == original.to
+    # Fields are taken as stored rather than coerced by the validators
+    assert isinstance(deserialized.id, str)
+
+def test_deserialize_dispatches_on_type():
+    """Test deserialization picks the model from the type field."""
+    original = APNote(
+        id="https://example.com/notes/123",
+        content="Test content"
+    )
+    deserialized = ActivityPubSerializer.deserialize(original.serialize())
+    
+    assert isinstance(deserialized, APNote)
+    assert deserialized.content == original.content
+
+def test_deserialize_unknown_type():
+    """Test deserialization without a model rejects unknown types."""
+    with pytest.raises(ValueError):
+        ActivityPubSerializer.deserialize({"type": "Unknown", "id": "https://example.com/x"})
+
+def test_serializer_caches():
+    """Test a frozen model is serialized to JSON bytes only once."""
+    note = APNote(
+        id="https://example.com/notes/123",
+        content="Test content"
+    )
+    with patch.object(
+        ActivityPubSerializer, 'serialize', wraps=ActivityPubSerializer.serialize
+    ) as mock_serialize:
+        first = note.to_json_bytes()
+        second = note.to_json_bytes()
+        
+        assert first is second
+        assert mock_serialize.call_count == 1
+    assert json.loads(first)["content"] == "Test content"
+    
+    updated = note.model_copy(update={"content": "Updated content"})
+    assert json.loads(updated.to_json_bytes())["content"] == "Updated content"
+
+def test_cached_json_keeps_equality():
+    """Test caching JSON bytes on a model does not affect equality."""
+    first = APNote(id="https://example.com/notes/123", content="Test content")
+    second = APNote(id="https://example.com/notes/123", content="Test content")
+    first.to_json_bytes()
+    
+    assert first == second
+    assert first.model_dump() == second.model_dump()
+
 def test_deserialize_with_extra_fields():
     """Test deserialization with extra fields in JSON."""
     data = {
@@ -175,6 +242,6 @@ def test_deserialize_with_extra_fields():
     obj = ActivityPubSerializer.deserialize(data, APObject)
     
     # Verify extra fields are handled
-    assert str(obj.id) == "https://example.com/object/123"
+    assert obj.id.unicode_string() == "https://example.com/object/123"
     assert obj.type == "Object"
     assert obj.name == "Test Object"
@@ -0,0 +1,97 @@
+"""
+Tests for the two-level query result cache.
+"""
+
+import asyncio
+import json
+import pytest
+from datetime import datetime
+
+from pyfed.storage.optimization import QueryOptimizer
+
+QUERY = "SELECT * FROM activities WHERE actor = $1"
+PARAMS = ("https://example.com/users/alice",)
+
+class FakeSharedCache:
+    """In-memory stand-in for a shared cache such as Redis."""
+
+    def __init__(self, fail: bool = False):
+        self.data = {}
+        self.fail = fail
+        self.gets = 0
+
+    async def get(self, key):
+        self.gets += 1
+        if self.fail:
+            raise ConnectionError("shared cache down")
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        if self.fail:
+            raise ConnectionError("shared cache down")
+        self.data[key] = value
+
+async def drain(optimizer: QueryOptimizer) -> None:
+    """Wait for pending write-through tasks."""
+    await asyncio.gather(*optimizer._pending_writes)
+
+@pytest.mark.asyncio
+async def test_write_through():
+    """Test cached results are written to the shared cache as JSON."""
+    shared = FakeSharedCache()
+    optimizer = QueryOptimizer(shared_cache=shared)
+    result = [{"id": "https://example.com/activities/1"}]
+
+    await optimizer.cache_result(QUERY, PARAMS, result)
+    await drain(optimizer)
+
+    assert [json.loads(value) for value in shared.data.values()] == [result]
+
+@pytest.mark.asyncio
+async def test_read_through():
+    """Test an L1 miss is served from the shared cache and kept locally."""
+    shared = FakeSharedCache()
+    writer = QueryOptimizer(shared_cache=shared)
+    result = [{"id": "https://example.com/activities/1"}]
+    await writer.cache_result(QUERY, PARAMS, result)
+    await drain(writer)
+
+    reader = QueryOptimizer(shared_cache=shared)
+    assert await reader.get_cached_result(QUERY, PARAMS) == result
+    assert await reader.get_cached_result(QUERY, PARAMS) == result
+    assert shared.gets == 1
+
+@pytest.mark.asyncio
+async def test_non_json_result_stays_local():
+    """Test results that are not JSON-native are not written to the shared cache."""
+    shared = FakeSharedCache()
+    optimizer = QueryOptimizer(shared_cache=shared)
+    result = [{"created_at": datetime(2024, 1, 1)}]
+
+    await optimizer.cache_result(QUERY, PARAMS, result)
+    await drain(optimizer)
+
+    assert shared.data == {}
+    assert await optimizer.get_cached_result(QUERY, PARAMS) == result
+
+@pytest.mark.asyncio
+async def test_invalid_shared_entry():
+    """Test a corrupt shared cache entry is treated as a miss."""
+    shared = FakeSharedCache()
+    optimizer = QueryOptimizer(shared_cache=shared)
+    shared.data[optimizer._shared_key(f"{QUERY}:{PARAMS}")] = b"{not json"
+
+    assert await optimizer.get_cached_result(QUERY, PARAMS) is None
+    assert optimizer.query_cache == {}
+
+@pytest.mark.asyncio
+async def test_shared_cache_failures():
+    """Test shared cache errors fall back to the local cache."""
+    shared = FakeSharedCache(fail=True)
+    optimizer = QueryOptimizer(shared_cache=shared)
+
+    assert await optimizer.get_cached_result(QUERY, PARAMS) is None
+
+    await optimizer.cache_result(QUERY, PARAMS, [1, 2, 3])
+    await drain(optimizer)
+    assert await optimizer.get_cached_result(QUERY, PARAMS) == [1, 2, 3]
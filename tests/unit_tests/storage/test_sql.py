@@ -0,0 +1,114 @@
+"""
+Tests for SQL storage backend pagination.
+"""
+
+import pytest
+from datetime import datetime
+from sqlalchemy import insert, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from pyfed.storage.sql import (
+    Activity, Follow, SQLStorageBackend,
+    _inbox_query, _outbox_query, _parse_cursor
+)
+from pyfed.utils.exceptions import StorageError
+
+ACTOR = "https://example.com/users/alice"
+
+def compile_pg(stmt) -> str:
+    """Compile a statement for PostgreSQL without binding literal values."""
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+def test_parse_cursor():
+    """Test a created_at|id cursor parses into its typed parts."""
+    created_at, item_id = _parse_cursor(
+        "2024-01-01T12:00:00|https://example.com/activities/1", Activity
+    )
+    assert created_at == datetime(2024, 1, 1, 12, 0, 0)
+    assert item_id == "https://example.com/activities/1"
+
+def test_parse_cursor_int_id():
+    """Test cursors for tables with integer keys yield an int id."""
+    _, item_id = _parse_cursor("2024-01-01T12:00:00|42", Follow)
+    assert item_id == 42
+
+def test_parse_cursor_invalid():
+    """Test a malformed cursor raises StorageError."""
+    with pytest.raises(StorageError):
+        _parse_cursor("not-a-cursor", Activity)
+
+def test_outbox_query_orders_by_keyset():
+    """Test the outbox query orders newest first with id as tie-breaker."""
+    sql = compile_pg(_outbox_query(ACTOR, 21))
+    assert "ORDER BY activities.created_at DESC, activities.id DESC" in sql
+    assert "LIMIT" in sql
+
+def test_outbox_query_inlines_public_visibility():
+    """Test the visibility filter is a literal matching the partial index."""
+    sql = compile_pg(_outbox_query(ACTOR, 21))
+    assert "activities.visibility = 'public'" in sql
+
+def test_inbox_query_inlines_visibility_list():
+    """Test the inbox visibility filter is a literal list, not a bind."""
+    sql = compile_pg(_inbox_query(ACTOR, 21))
+    assert "activities.visibility IN ('public', 'followers')" in sql
+    assert "POSTCOMPILE" not in sql
+
+def test_inbox_query_is_union_all():
+    """Test the inbox query combines its two branches with UNION ALL."""
+    sql = compile_pg(_inbox_query(ACTOR, 21))
+    assert "UNION ALL" in sql
+    assert " OR " not in sql
+
+@pytest.fixture
+async def storage():
+    """Create a backend reading from an in-memory SQLite activities table."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.execute(text(
+            "CREATE TABLE activities ("
+            "id VARCHAR PRIMARY KEY, type VARCHAR, actor VARCHAR, "
+            "object_id VARCHAR, target_id VARCHAR, data JSON, local BOOLEAN, "
+            "visibility VARCHAR, created_at DATETIME)"
+        ))
+    backend = SQLStorageBackend("sqlite+aiosqlite://")
+    backend.read_engine = engine
+    yield backend
+    await engine.dispose()
+
+async def insert_activities(backend, ids, created_at):
+    """Insert public activities by ACTOR that all share one timestamp."""
+    async with backend.read_engine.begin() as conn:
+        await conn.execute(
+            insert(Activity.__table__),
+            [
+                {
+                    "id": activity_id,
+                    "type": "Create",
+                    "actor": ACTOR,
+                    "data": {"id": activity_id},
+                    "visibility": "public",
+                    "created_at": created_at
+                }
+                for activity_id in ids
+            ]
+        )
+
+@pytest.mark.asyncio
+async def test_outbox_pages_keep_tied_timestamps(storage):
+    """Test rows sharing the boundary timestamp are not skipped between pages."""
+    ids = [f"https://example.com/activities/{i}" for i in range(5)]
+    await insert_activities(storage, ids, datetime(2024, 1, 1, 12, 0, 0))
+
+    seen = []
+    cursor = None
+    for _ in range(len(ids)):
+        items, cursor = await storage.get_outbox(ACTOR, limit=2, cursor=cursor)
+        seen.extend(item["id"] for item in items)
+        if cursor is None:
+            break
+
+    assert cursor is None
+    assert sorted(seen) == sorted(ids)
+    assert len(seen) == len(set(seen))
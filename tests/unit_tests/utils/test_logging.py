@@ -0,0 +1,46 @@
+"""
+Tests for logging configuration.
+"""
+
+import logging
+import logging.handlers
+import pytest
+
+from pyfed.utils import logging as pyfed_logging
+from pyfed.utils.logging import configure_logging
+
+@pytest.fixture
+def root(monkeypatch, tmp_path):
+    """Restore the root logger and run in a scratch log directory."""
+    root = logging.getLogger()
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(root, "handlers", root.handlers)
+    monkeypatch.setattr(root, "level", root.level)
+    yield root
+    if pyfed_logging._listener is not None:
+        pyfed_logging._listener.stop()
+        for handler in pyfed_logging._listener.handlers:
+            handler.close()
+    pyfed_logging._listener = None
+    pyfed_logging._queue_handler = None
+
+def test_configure_logging_installs_queue_handler(root):
+    """Test records go through a single queue handler, even when reconfigured."""
+    # pytest's capture handlers are attached for each phase, so clear them here
+    root.handlers = []
+    configure_logging("debug")
+    configure_logging()
+
+    assert len(root.handlers) == 1
+    assert isinstance(root.handlers[0], logging.handlers.QueueHandler)
+    assert root.level == logging.INFO
+
+def test_configure_logging_keeps_existing_handlers(root):
+    """Test an application's own root handlers are left alone."""
+    existing = logging.NullHandler()
+    root.handlers = [existing]
+
+    configure_logging("debug")
+
+    assert root.handlers == [existing]
+    assert pyfed_logging._listener is None